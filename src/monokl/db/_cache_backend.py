@@ -7,6 +7,7 @@ This is an internal module - use WorkStore for public API.
 from __future__ import annotations
 
 import json
+from dataclasses import dataclass
 from datetime import datetime
 from datetime import timedelta
 from typing import TYPE_CHECKING
@@ -24,6 +25,21 @@ logger = get_logger(__name__)
 DEFAULT_CLEANUP_DAYS = 30
 
 
+@dataclass(frozen=True, slots=True)
+class _CacheEntry:
+    """Cached payload together with its freshness and last recorded error.
+
+    Attributes:
+        data: Deserialized list of cached items.
+        is_valid: True if the entry is still within its TTL.
+        last_error: Last error recorded for the cache key, if any.
+    """
+
+    data: list[dict[str, Any]]
+    is_valid: bool
+    last_error: str | None
+
+
 class _CacheBackend:
     """Internal cache backend with TTL support.
 
@@ -94,6 +110,58 @@ class _CacheBackend:
             logger.error("Failed to get cached data", cache_key=cache_key, error=str(e))
             return None
 
+    async def get_many(self, cache_keys: list[str]) -> dict[str, _CacheEntry]:
+        """Get several cache entries, including stale ones, in a single query.
+
+        Args:
+            cache_keys: Cache keys to look up.
+
+        Returns:
+            Dictionary mapping found cache keys to their entries. Missing or
+            unparsable entries are left out.
+        """
+        if not cache_keys:
+            return {}
+
+        try:
+            db = get_db_manager()
+            conn = await db.get_connection()
+
+            placeholders = ", ".join("?" for _ in cache_keys)
+            cursor = await conn.execute(
+                f"""
+                SELECT cache_key, raw_json, cached_at, ttl_seconds, last_error
+                FROM cached_data WHERE cache_key IN ({placeholders})
+                """,  # noqa: S608 - placeholders only, values are bound
+                cache_keys,
+            )
+            rows = await cursor.fetchall()
+        except Exception as e:
+            logger.error("Failed to get cached data", cache_keys=cache_keys, error=str(e))
+            return {}
+
+        now = datetime.now()
+        entries: dict[str, _CacheEntry] = {}
+        for cache_key, raw_json, cached_at_str, ttl_seconds, last_error in rows:
+            try:
+                data = json.loads(raw_json)
+            except json.JSONDecodeError as e:
+                logger.warning("Failed to parse cached data", cache_key=cache_key, error=str(e))
+                continue
+            if not isinstance(data, list):
+                logger.warning("Cached data is not a list", cache_key=cache_key)
+                continue
+
+            expires_at = datetime.fromisoformat(cached_at_str) + timedelta(seconds=ttl_seconds)
+            entries[cache_key] = _CacheEntry(
+                data=data,
+                is_valid=now < expires_at,
+                last_error=last_error,
+            )
+
+        logger.debug("Cache batch lookup", requested=len(cache_keys), found=len(entries))
+        return entries
+
     async def set(
         self,
         cache_key: str,
@@ -117,22 +185,26 @@ class _CacheBackend:
             db = get_db_manager()
             conn = await db.get_connection()
 
-            # Delete existing record
-            await conn.execute(
-                "DELETE FROM cached_data WHERE cache_key = ?",
-                (cache_key,),
-            )
-
             # Serialize data
             raw_json = json.dumps(data)
             cached_at = datetime.now().isoformat()
 
-            # Insert new record
+            # Replace any existing record in a single statement (and so a single
+            # implicit transaction), resetting its fetch count and last error
             await conn.execute(
                 """
                 INSERT INTO cached_data
                 (cache_key, data_type, source, subsection, raw_json, cached_at, ttl_seconds, fetch_count)
                 VALUES (?, ?, ?, ?, ?, ?, ?, 1)
+                ON CONFLICT(cache_key) DO UPDATE SET
+                    data_type = excluded.data_type,
+                    source = excluded.source,
+                    subsection = excluded.subsection,
+                    raw_json = excluded.raw_json,
+                    cached_at = excluded.cached_at,
+                    ttl_seconds = excluded.ttl_seconds,
+                    fetch_count = 1,
+                    last_error = NULL
                 """,
                 (cache_key, data_type, source, subsection, raw_json, cached_at, ttl_seconds),
             )
@@ -100,6 +100,8 @@ class DatabaseManager:
         await self._connection.execute("PRAGMA foreign_keys = ON")
         await self._connection.execute("PRAGMA journal_mode = WAL")
         await self._connection.execute("PRAGMA synchronous = NORMAL")
+        # Keep temporary tables and sort buffers off disk
+        await self._connection.execute("PRAGMA temp_store = MEMORY")
 
         # Initialize schema
         await init_schema(self._connection)
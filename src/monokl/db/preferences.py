@@ -94,6 +94,75 @@ class PreferencesManager:
         except Exception as e:
             logger.error("Failed to set preference", key=key, error=str(e))
 
+    async def get_many(self, defaults: dict[str, Any]) -> dict[str, Any]:
+        """Get several preference values with a single query.
+
+        Args:
+            defaults: Mapping of preference keys to their default values.
+
+        Returns:
+            Mapping of each requested key to its deserialized value, or to
+            its default if not found.
+        """
+        result = dict(defaults)
+        if not defaults:
+            return result
+
+        try:
+            db = get_db_manager()
+            conn = await db.get_connection()
+
+            placeholders = ", ".join("?" * len(defaults))
+            cursor = await conn.execute(
+                f"""
+                SELECT key, value FROM user_preferences WHERE key IN ({placeholders})
+                """,  # noqa: S608 - placeholders only, values are bound
+                list(defaults),
+            )
+            for key, value_json in await cursor.fetchall():
+                try:
+                    result[key] = json.loads(value_json)
+                except json.JSONDecodeError:
+                    # Fallback to raw string for legacy values
+                    result[key] = value_json
+
+        except Exception as e:
+            logger.error("Failed to get preferences", keys=list(defaults), error=str(e))
+            return dict(defaults)
+
+        return result
+
+    async def set_many(self, values: dict[str, Any]) -> None:
+        """Set several preference values in a single statement.
+
+        Args:
+            values: Mapping of preference keys to values (JSON-serialized).
+        """
+        if not values:
+            return
+
+        try:
+            db = get_db_manager()
+            conn = await db.get_connection()
+
+            rows = ", ".join("(?, ?, CURRENT_TIMESTAMP)" for _ in values)
+            params = [item for key, value in values.items() for item in (key, json.dumps(value))]
+            await conn.execute(
+                f"""
+                INSERT INTO user_preferences (key, value, updated_at)
+                VALUES {rows}
+                ON CONFLICT(key) DO UPDATE SET
+                    value = excluded.value,
+                    updated_at = CURRENT_TIMESTAMP
+                """,  # noqa: S608 - placeholders only, values are bound
+                params,
+            )
+
+            logger.debug("Saved preferences", keys=list(values))
+
+        except Exception as e:
+            logger.error("Failed to set preferences", keys=list(values), error=str(e))
+
     async def delete(self, key: str) -> bool:
         """Delete a preference.
 
@@ -175,6 +244,22 @@ class PreferencesManager:
         """Save the last MR subsection."""
         await self.set("last_mr_subsection", subsection)
 
+    async def get_ui_state(
+        self, default_section: str = "mr", default_subsection: str = "assigned"
+    ) -> tuple[str, str]:
+        """Get the last active section and MR subsection in one query."""
+        values = await self.get_many(
+            {
+                "last_active_section": default_section,
+                "last_mr_subsection": default_subsection,
+            }
+        )
+        return values["last_active_section"], values["last_mr_subsection"]
+
+    async def set_ui_state(self, section: str, subsection: str) -> None:
+        """Save the last active section and MR subsection in one statement."""
+        await self.set_many({"last_active_section": section, "last_mr_subsection": subsection})
+
     async def get_sort_preference(
         self, section_id: str, preserve_sort: bool = True
     ) -> dict[str, Any] | None:
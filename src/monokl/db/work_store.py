@@ -12,6 +12,8 @@ from typing import TYPE_CHECKING
 from typing import Any
 from typing import Literal
 
+from pydantic import BaseModel
+
 from monokl import get_logger
 from monokl.db._cache_backend import _CacheBackend
 from monokl.db._source_health import _SourceHealth
@@ -33,7 +35,7 @@ DEFAULT_WORK_ITEM_TTL = 600  # 10 minutes
 DEFAULT_BACKGROUND_TIMEOUT = 30  # 30 seconds
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FetchResult[T]:
     """Result of a fetch operation with metadata.
 
@@ -115,39 +117,79 @@ class WorkStore:
         Returns:
             FetchResult with code reviews and metadata.
         """
-        if force_refresh:
-            return await self._fetch_code_reviews(subsection)
+        results = await self.get_code_reviews_bulk([subsection], force_refresh=force_refresh)
+        return results[subsection]
 
-        cached_result = await self._get_cached_code_reviews(subsection)
-        if cached_result is None:
-            return await self._fetch_code_reviews(subsection)
+    async def get_code_reviews_bulk(
+        self,
+        subsections: list[Literal["assigned", "opened"]],
+        *,
+        force_refresh: bool = False,
+        refresh_stale: bool = True,
+        fetch_missing: bool = True,
+    ) -> dict[str, FetchResult[CodeReview]]:
+        """Get code reviews for several subsections at once.
 
-        cached_data, cached_errors = cached_result
-        all_reviews: list[CodeReview] = self._flatten_cached_data(cached_data)
-        is_fresh = await self._is_any_fresh("code_reviews", subsection)
+        Same semantics as get_code_reviews(), but cached data for all
+        requested subsections is read in a single database round trip and
+        subsections that need fetching are fetched concurrently.
 
-        if not is_fresh:
-            self._trigger_background_refresh(data_type="code_reviews", subsection=subsection)
+        Args:
+            subsections: Subsections to get ("assigned" and/or "opened").
+            force_refresh: If True, bypass cache and fetch fresh data.
+            refresh_stale: If False, don't start a background refresh for
+                stale cached data (for callers that fetch fresh data themselves).
+            fetch_missing: If False, subsections with nothing cached come back
+                empty and stale instead of being fetched from sources.
 
-        # Sources with cached data that have errors are considered "failed"
-        failed_sources = list(cached_errors.keys())
+        Returns:
+            Dictionary mapping each requested subsection to its FetchResult.
+        """
+        cached = {} if force_refresh else await self._get_cached_code_reviews(subsections)
+
+        # Subsections without cached data are fetched from sources concurrently
+        to_fetch = [subsection for subsection in subsections if subsection not in cached]
+        results: dict[str, FetchResult[CodeReview]]
+        if fetch_missing:
+            fetched = await asyncio.gather(
+                *(self._fetch_code_reviews(subsection) for subsection in to_fetch)
+            )
+            results = dict(zip(to_fetch, fetched, strict=True))
+        else:
+            results = {
+                subsection: FetchResult(data=[], fresh=False, failed_sources=[], errors={})
+                for subsection in to_fetch
+            }
+
+        for subsection, (cached_data, cached_errors, is_fresh) in cached.items():
+            if refresh_stale and not is_fresh:
+                self._trigger_background_refresh(data_type="code_reviews", subsection=subsection)
+
+            # Sources with cached data that have errors are considered "failed"
+            results[subsection] = FetchResult(
+                data=self._flatten_cached_data(cached_data),
+                fresh=False,
+                failed_sources=list(cached_errors.keys()),
+                errors=cached_errors,
+            )
 
-        return FetchResult(
-            data=all_reviews,
-            fresh=False,
-            failed_sources=failed_sources,
-            errors=cached_errors,
-        )
+        return results
 
     async def get_work_items(
         self,
         *,
         force_refresh: bool = False,
+        refresh_stale: bool = True,
+        fetch_missing: bool = True,
     ) -> FetchResult[PieceOfWork]:
         """Get work items with automatic fetch/cache/background refresh.
 
         Args:
             force_refresh: If True, bypass cache and fetch fresh data.
+            refresh_stale: If False, don't start a background refresh for
+                stale cached data (for callers that fetch fresh data themselves).
+            fetch_missing: If False and nothing is cached, return an empty,
+                stale result instead of fetching from sources.
 
         Returns:
             FetchResult with work items and metadata.
@@ -157,13 +199,14 @@ class WorkStore:
 
         cached_result = await self._get_cached_work_items()
         if cached_result is None:
+            if not fetch_missing:
+                return FetchResult(data=[], fresh=False, failed_sources=[], errors={})
             return await self._fetch_work_items()
 
-        cached_data, cached_errors = cached_result
+        cached_data, cached_errors, is_fresh = cached_result
         all_items: list[PieceOfWork] = self._flatten_cached_data(cached_data)
-        is_fresh = await self._is_any_fresh("work_items")
 
-        if not is_fresh:
+        if refresh_stale and not is_fresh:
             self._trigger_background_refresh(data_type="work_items")
 
         # Sources with cached data that have errors are considered "failed"
@@ -200,17 +243,23 @@ class WorkStore:
         self,
         data_type: Literal["code_reviews", "work_items"],
         source: str | None = None,
+        *,
+        all_sources: bool = False,
     ) -> bool:
         """Check if cache is fresh for a data type.
 
         Args:
             data_type: Type of data to check.
             source: Specific source to check, or None for all sources.
+            all_sources: Without a source, require every source's cache to be fresh
+                rather than any of them.
 
         Returns:
             True if cache is fresh, False otherwise.
         """
         if not source:
+            if all_sources:
+                return await self._is_all_fresh(data_type)
             # Check all sources for this data type
             return await self._is_any_fresh(data_type)
 
@@ -237,34 +286,47 @@ class WorkStore:
 
     async def _get_cached_code_reviews(
         self,
-        subsection: str,
-    ) -> tuple[dict[str, list[CodeReview]], dict[str, str]] | None:
-        """Get cached code reviews from all sources.
+        subsections: list[str],
+    ) -> dict[str, tuple[dict[str, list[CodeReview]], dict[str, str], bool]]:
+        """Get cached code reviews from all sources for the given subsections.
+
+        All cache entries are read with a single query.
 
         Returns:
-            Tuple of (data dict, errors dict) or None if no cached data.
+            Dictionary mapping subsections to a tuple of (data dict, errors
+            dict, any source fresh). Subsections without cached data are
+            left out.
         """
-        result: dict[str, list[CodeReview]] = {}
-        errors: dict[str, str] = {}
+        source_types = [source.source_type for source in self._registry.get_code_review_sources()]
+        cache_keys = {
+            (subsection, source_type): f"code_reviews:{source_type}:{subsection}"
+            for subsection in subsections
+            for source_type in source_types
+        }
+        entries = await self._cache.get_many(list(cache_keys.values()))
 
-        for source in self._registry.get_code_review_sources():
-            source_type = source.source_type
-            cache_key = f"code_reviews:{source_type}:{subsection}"
+        cached: dict[str, tuple[dict[str, list[CodeReview]], dict[str, str], bool]] = {}
+        for subsection in subsections:
+            result: dict[str, list[CodeReview]] = {}
+            errors: dict[str, str] = {}
+            is_fresh = False
 
-            cached = await self._cache.get(cache_key, accept_stale=True)
-            if cached is None:
-                continue
+            for source_type in source_types:
+                entry = entries.get(cache_keys[subsection, source_type])
+                if entry is None:
+                    continue
 
-            reviews = self._deserialize_code_reviews(cached, source_type)
-            if reviews:
-                result[source_type] = reviews
+                reviews = self._deserialize_code_reviews(entry.data, source_type)
+                if reviews:
+                    result[source_type] = reviews
+                if entry.last_error:
+                    errors[source_type] = entry.last_error
+                is_fresh = is_fresh or entry.is_valid
 
-            # Get error info for this source
-            cache_info = await self._cache.get_cache_info(cache_key)
-            if cache_info and cache_info.get("last_error"):
-                errors[source_type] = cache_info["last_error"]
+            if result:
+                cached[subsection] = (result, errors, is_fresh)
 
-        return (result, errors) if result else None
+        return cached
 
     def _deserialize_code_reviews(
         self, cached: list[dict[str, Any]], source_type: str
@@ -283,33 +345,37 @@ class WorkStore:
 
     async def _get_cached_work_items(
         self,
-    ) -> tuple[dict[str, list[PieceOfWork]], dict[str, str]] | None:
+    ) -> tuple[dict[str, list[PieceOfWork]], dict[str, str], bool] | None:
         """Get cached work items from all sources.
 
+        All cache entries are read with a single query.
+
         Returns:
-            Tuple of (data dict, errors dict) or None if no cached data.
+            Tuple of (data dict, errors dict, any source fresh) or None if
+            no cached data.
         """
+        source_types = [source.source_type for source in self._registry.get_piece_of_work_sources()]
+        entries = await self._cache.get_many(
+            [f"work_items:{source_type}" for source_type in source_types]
+        )
+
         result: dict[str, list[PieceOfWork]] = {}
         errors: dict[str, str] = {}
+        is_fresh = False
 
-        for source in self._registry.get_piece_of_work_sources():
-            source_type = source.source_type
-            cache_key = f"work_items:{source_type}"
-
-            cached = await self._cache.get(cache_key, accept_stale=True)
-            if cached is None:
+        for source_type in source_types:
+            entry = entries.get(f"work_items:{source_type}")
+            if entry is None:
                 continue
 
-            items = self._deserialize_work_items(cached, source_type)
+            items = self._deserialize_work_items(entry.data, source_type)
             if items:
                 result[source_type] = items
+            if entry.last_error:
+                errors[source_type] = entry.last_error
+            is_fresh = is_fresh or entry.is_valid
 
-            # Get error info for this source
-            cache_info = await self._cache.get_cache_info(cache_key)
-            if cache_info and cache_info.get("last_error"):
-                errors[source_type] = cache_info["last_error"]
-
-        return (result, errors) if result else None
+        return (result, errors, is_fresh) if result else None
 
     def _deserialize_work_items(
         self, cached: list[dict[str, Any]], source_type: str
@@ -352,6 +418,24 @@ class WorkStore:
             return False
         return await freshness_strategy(subsection)
 
+    async def _is_all_fresh(self, data_type: str) -> bool:
+        """Check that the cache of every configured source is fresh.
+
+        With no configured sources there is nothing fresh to report, so this is False.
+        """
+        if data_type == "code_reviews":
+            sources = self._registry.get_code_review_sources()
+        elif data_type == "work_items":
+            sources = self._registry.get_piece_of_work_sources()
+        else:
+            return False
+        if not sources:
+            return False
+        results = await asyncio.gather(
+            *(self.is_fresh(data_type, source.source_type) for source in sources)
+        )
+        return all(results)
+
     @property
     def _freshness_strategies(self) -> dict[str, callable]:
         """Get mapping of data types to freshness check strategies."""
@@ -361,11 +445,16 @@ class WorkStore:
         }
 
     async def _is_any_code_review_fresh(self, subsection: str | None = None) -> bool:
-        """Check if any code review cache is fresh."""
+        """Check if any code review cache is fresh.
+
+        Without a subsection, both "assigned" and "opened" caches are checked.
+        """
+        subsections = (subsection,) if subsection else ("assigned", "opened")
         for source in self._registry.get_code_review_sources():
-            cache_key = f"code_reviews:{source.source_type}:{subsection}"
-            if await self._cache.is_fresh(cache_key):
-                return True
+            for name in subsections:
+                cache_key = f"code_reviews:{source.source_type}:{name}"
+                if await self._cache.is_fresh(cache_key):
+                    return True
         return False
 
     async def _is_any_work_item_fresh(self, _subsection: str | None = None) -> bool:
@@ -430,28 +519,24 @@ class WorkStore:
         subsection: str,
     ) -> FetchResult[CodeReview]:
         """Fetch code reviews from all sources."""
-        source_order = self._get_prioritized_sources()
+        sources = self._get_prioritized_sources()
 
-        results = await self._fetch_from_all_code_review_sources(source_order, subsection)
+        results = await self._fetch_from_all_code_review_sources(sources, subsection)
 
         return self._aggregate_fetch_results(results)
 
-    def _get_prioritized_sources(self) -> list[str]:
-        """Get source names sorted by priority (failed ones first)."""
-        sources = self._registry.get_code_review_sources()
-        source_names = [s.source_type for s in sources]
-        return self._health.get_priority_sources(source_names)
+    def _get_prioritized_sources(self) -> list[CodeReviewSource]:
+        """Get code review sources sorted by priority (failed ones first)."""
+        source_map = {s.source_type: s for s in self._registry.get_code_review_sources()}
+        return [source_map[name] for name in self._health.get_priority_sources(list(source_map))]
 
     async def _fetch_from_all_code_review_sources(
-        self, source_order: list[str], subsection: str
+        self, sources: list[CodeReviewSource], subsection: str
     ) -> list[tuple[str, list[CodeReview], str | None]]:
-        """Fetch from all sources concurrently and return results."""
-        sources = self._registry.get_code_review_sources()
-        source_map = {s.source_type: s for s in sources}
-
+        """Fetch from the given sources concurrently and return results."""
         tasks = [
-            self._fetch_single_code_review_source(source_map[name], name, subsection)
-            for name in source_order
+            self._fetch_single_code_review_source(source, source.source_type, subsection)
+            for source in sources
         ]
         raw_results = await asyncio.gather(*tasks, return_exceptions=True)
 
@@ -503,10 +588,11 @@ class WorkStore:
     async def _cache_code_reviews(
         self, source_name: str, subsection: str, reviews: list[CodeReview]
     ) -> None:
-        """Cache code review results."""
-        if not reviews:
-            return
+        """Cache code review results.
 
+        Empty results are cached too, so a source that no longer has any
+        items replaces its previous entry rather than leaving it behind.
+        """
         cache_key = f"code_reviews:{source_name}:{subsection}"
         data = [r.model_dump(mode="json", by_alias=True) for r in reviews]
         await self._cache.set(
@@ -542,26 +628,22 @@ class WorkStore:
 
     async def _fetch_work_items(self) -> FetchResult[PieceOfWork]:
         """Fetch work items from all sources."""
-        source_order = self._get_prioritized_work_sources()
+        sources = self._get_prioritized_work_sources()
 
-        results = await self._fetch_from_all_work_sources(source_order)
+        results = await self._fetch_from_all_work_sources(sources)
 
         return self._aggregate_work_fetch_results(results)
 
-    def _get_prioritized_work_sources(self) -> list[str]:
-        """Get work source names sorted by priority (failed ones first)."""
-        sources = self._registry.get_piece_of_work_sources()
-        source_names = [s.source_type for s in sources]
-        return self._health.get_priority_sources(source_names)
+    def _get_prioritized_work_sources(self) -> list[PieceOfWorkSource]:
+        """Get work sources sorted by priority (failed ones first)."""
+        source_map = {s.source_type: s for s in self._registry.get_piece_of_work_sources()}
+        return [source_map[name] for name in self._health.get_priority_sources(list(source_map))]
 
     async def _fetch_from_all_work_sources(
-        self, source_order: list[str]
+        self, sources: list[PieceOfWorkSource]
     ) -> list[tuple[str, list[PieceOfWork], str | None]]:
-        """Fetch from all work sources concurrently and return results."""
-        sources = self._registry.get_piece_of_work_sources()
-        source_map = {s.source_type: s for s in sources}
-
-        tasks = [self._fetch_single_work_source(source_map[name], name) for name in source_order]
+        """Fetch from the given work sources concurrently and return results."""
+        tasks = [self._fetch_single_work_source(source, source.source_type) for source in sources]
         raw_results = await asyncio.gather(*tasks, return_exceptions=True)
 
         results: list[tuple[str, list[PieceOfWork], str | None]] = []
@@ -589,10 +671,11 @@ class WorkStore:
             return source_name, [], error_msg
 
     async def _cache_work_items(self, source_name: str, items: list[PieceOfWork]) -> None:
-        """Cache work item results."""
-        if not items:
-            return
+        """Cache work item results.
 
+        Empty results are cached too, so a source that no longer has any
+        items replaces its previous entry rather than leaving it behind.
+        """
         cache_key = f"work_items:{source_name}"
         data = self._serialize_work_items(items, source_name)
         await self._cache.set(
@@ -607,8 +690,6 @@ class WorkStore:
         self, items: list[PieceOfWork], source_name: str
     ) -> list[dict[str, Any]]:
         """Serialize work items for caching."""
-        from pydantic import BaseModel
-
         data: list[dict[str, Any]] = []
         for item in items:
             if isinstance(item, BaseModel):
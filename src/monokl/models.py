@@ -36,6 +36,29 @@ def parse_datetime(value: datetime | str | None) -> datetime | None:
 # Type alias for datetime fields that accept ISO 8601 strings
 IsoDateTime = t.Annotated[datetime | None, BeforeValidator(parse_datetime)]
 
+# Lookup tables used by the display/status helpers below. They are built once
+# here rather than on every call, since those helpers run per row on each
+# sort and render.
+_JIRA_PRIORITY_MAP = {
+    "Lowest": 1,
+    "Low": 2,
+    "Medium": 3,
+    "High": 4,
+    "Highest": 5,
+}
+_JIRA_STATUS_MAP = {
+    "TO DO": "TODO",
+    "IN PROGRESS": "IN PROGRESS",
+    "DONE": "DONE",
+    "BLOCKED": "BLOCKED",
+    "CLOSED": "DONE",
+    "RESOLVED": "DONE",
+}
+_JIRA_CLOSED_STATUSES = frozenset({"done", "closed", "resolved"})
+_TODOIST_PRIORITY_LABELS = {1: "LOW", 2: "MEDIUM", 3: "HIGH", 4: "HIGHEST"}
+_AZURE_STATUS_MAP = {**_JIRA_STATUS_MAP, "REMOVED": "REMOVED"}
+_AZURE_CLOSED_STATUSES = frozenset({"Closed", "Done", "Removed", "Resolved"})
+
 
 class DueInfo(TypedDict, total=False):
     """Todoist due date information.
@@ -443,14 +466,7 @@ class JiraPieceOfWork(BaseModel):
             priority_field.get("name", "None") if isinstance(priority_field, dict) else "None"
         )
         # Map Jira priority names to numeric values
-        priority_map = {
-            "Lowest": 1,
-            "Low": 2,
-            "Medium": 3,
-            "High": 4,
-            "Highest": 5,
-        }
-        return priority_map.get(priority_name)
+        return _JIRA_PRIORITY_MAP.get(priority_name)
 
     @property
     def assignee(self) -> str | None:
@@ -494,20 +510,11 @@ class JiraPieceOfWork(BaseModel):
         """Return normalized status string."""
         status_name = self.status.upper()
         # Normalize common Jira statuses
-        status_map = {
-            "TO DO": "TODO",
-            "IN PROGRESS": "IN PROGRESS",
-            "DONE": "DONE",
-            "BLOCKED": "BLOCKED",
-            "CLOSED": "DONE",
-            "RESOLVED": "DONE",
-        }
-        return status_map.get(status_name, status_name)
+        return _JIRA_STATUS_MAP.get(status_name, status_name)
 
     def is_open(self) -> bool:
         """Check if work item is open/ongoing."""
-        closed_statuses = {"done", "closed", "resolved"}
-        return self.status.lower() not in closed_statuses
+        return self.status.lower() not in _JIRA_CLOSED_STATUSES
 
 
 # Backwards compatibility alias
@@ -613,8 +620,7 @@ class TodoistPieceOfWork(BaseModel):
         Returns:
             Standard priority label
         """
-        mapping = {1: "LOW", 2: "MEDIUM", 3: "HIGH", 4: "HIGHEST"}
-        return mapping.get(priority, "MEDIUM")
+        return _TODOIST_PRIORITY_LABELS.get(priority, "MEDIUM")
 
 
 # Backwards compatibility alias
@@ -746,18 +752,8 @@ class AzureDevOpsPieceOfWork(BaseModel):
     def display_status(self) -> str:
         """Return normalized status string."""
         status_name = self.status.upper()
-        status_map = {
-            "TO DO": "TODO",
-            "IN PROGRESS": "IN PROGRESS",
-            "DONE": "DONE",
-            "BLOCKED": "BLOCKED",
-            "CLOSED": "DONE",
-            "RESOLVED": "DONE",
-            "REMOVED": "REMOVED",
-        }
-        return status_map.get(status_name, status_name)
+        return _AZURE_STATUS_MAP.get(status_name, status_name)
 
     def is_open(self) -> bool:
         """Check if work item is open/ongoing."""
-        closed_statuses = {"Closed", "Done", "Removed", "Resolved"}
-        return self.status not in closed_statuses
+        return self.status not in _AZURE_CLOSED_STATUSES
@@ -4,7 +4,7 @@ Provides mechanisms to detect if CLI tools are installed and authenticated,
 with caching to avoid repeated system calls.
 """
 
-import shutil
+import asyncio
 from typing import TypedDict
 
 from monokl import get_logger
@@ -34,7 +34,7 @@ class DetectionResult(TypedDict):
 class CLIDetector:
     """Detects if a specific CLI is installed and authenticated.
 
-    This class checks both installation status (via shutil.which) and
+    This class checks both installation status (via a PATH lookup) and
     authentication status (via a lightweight trial command).
 
     Example:
@@ -59,8 +59,10 @@ class CLIDetector:
     async def check_availability(self) -> DetectionResult:
         """Check if the CLI is installed and authenticated.
 
-        First checks if the executable exists using shutil.which().
-        If installed, runs the test command to validate authentication.
+        Runs the test command to validate authentication. run_cli_command
+        already looks the executable up on PATH and raises CLINotFoundError
+        when it is missing, so that single lookup also answers whether the
+        CLI is installed.
 
         Returns:
             DetectionResult with status fields populated:
@@ -81,17 +83,6 @@ class CLIDetector:
         """
         logger.debug("Checking CLI availability", cli=self.cli_name)
 
-        # Check if CLI is installed
-        if not shutil.which(self.cli_name):
-            logger.warning("CLI not installed", cli=self.cli_name)
-            return DetectionResult(
-                cli_name=self.cli_name,
-                is_installed=False,
-                is_authenticated=False,
-                error_message=f"{self.cli_name}: command not found",
-            )
-
-        # Check if CLI is authenticated
         try:
             await run_cli_command([self.cli_name] + self.test_args, timeout=10.0)
             logger.debug("CLI authenticated", cli=self.cli_name)
@@ -110,8 +101,7 @@ class CLIDetector:
                 error_message=e.message,
             )
         except CLINotFoundError:
-            # This shouldn't happen since we checked above, but handle it
-            logger.error("CLI unexpectedly not found", cli=self.cli_name)
+            logger.warning("CLI not installed", cli=self.cli_name)
             return DetectionResult(
                 cli_name=self.cli_name,
                 is_installed=False,
@@ -198,8 +188,6 @@ class DetectionRegistry:
         if self._cached_results is not None:
             return self._cached_results.copy()
 
-        import asyncio
-
         logger.info("Running CLI detection", cli_count=len(self._detectors))
 
         # Run all detectors concurrently
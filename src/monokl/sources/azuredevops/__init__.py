@@ -6,6 +6,7 @@ Implements CodeReviewSource and PieceOfWorkSource protocols.
 
 from __future__ import annotations
 
+import asyncio
 import typing as t
 
 from monokl import get_logger
@@ -24,6 +25,10 @@ from monokl.sources.base import SetupResult
 
 from ._api import AzureDevOpsAPIAdapter
 
+if t.TYPE_CHECKING:
+    from collections.abc import Awaitable
+    from collections.abc import Callable
+
 logger = get_logger(__name__)
 
 
@@ -229,6 +234,35 @@ class AzureDevOpsSource(CodeReviewSource, PieceOfWorkSource, SetupCapableSource)
     def get_external_command(self, action_id: str) -> str | None:
         return None
 
+    async def _fetch_from_adapters(
+        self,
+        fetch: Callable[[AzureDevOpsAPIAdapter], Awaitable[list[t.Any]]],
+        failure_message: str,
+    ) -> list[t.Any]:
+        """Run a fetch against every organization concurrently.
+
+        Args:
+            fetch: Coroutine function fetching items from one adapter.
+            failure_message: Log message used when an organization fails.
+
+        Returns:
+            Items from all organizations that succeeded, in adapter order.
+        """
+
+        async def fetch_one(adapter: AzureDevOpsAPIAdapter) -> list[t.Any]:
+            try:
+                return await fetch(adapter)
+            except Exception as e:
+                logger.warning(
+                    failure_message,
+                    organization=adapter.organization,
+                    error=str(e),
+                )
+                return []
+
+        results = await asyncio.gather(*(fetch_one(adapter) for adapter in self._adapters))
+        return [item for items in results for item in items]
+
     async def fetch_assigned(self) -> list[CodeReview]:
         """Fetch PRs assigned to the current user.
 
@@ -239,18 +273,11 @@ class AzureDevOpsSource(CodeReviewSource, PieceOfWorkSource, SetupCapableSource)
             "Fetching assigned Azure DevOps PRs",
             organizations=len(self._adapters),
         )
-        all_prs: list[CodeReview] = []
-        for adapter in self._adapters:
-            try:
-                prs = await adapter.fetch_pull_requests()
-                all_prs.extend([self._convert_pr(pr) for pr in prs])
-            except Exception as e:
-                logger.warning(
-                    "Failed to fetch PRs from adapter",
-                    organization=adapter.organization,
-                    error=str(e),
-                )
-        return all_prs
+        prs = await self._fetch_from_adapters(
+            lambda adapter: adapter.fetch_pull_requests(),
+            "Failed to fetch PRs from adapter",
+        )
+        return [self._convert_pr(pr) for pr in prs]
 
     async def fetch_authored(self) -> list[CodeReview]:
         """Fetch PRs authored by the current user.
@@ -262,18 +289,11 @@ class AzureDevOpsSource(CodeReviewSource, PieceOfWorkSource, SetupCapableSource)
             "Fetching authored Azure DevOps PRs",
             organizations=len(self._adapters),
         )
-        all_prs: list[CodeReview] = []
-        for adapter in self._adapters:
-            try:
-                prs = await adapter.fetch_pull_requests(creator_id="@me")
-                all_prs.extend([self._convert_pr(pr) for pr in prs])
-            except Exception as e:
-                logger.warning(
-                    "Failed to fetch authored PRs from adapter",
-                    organization=adapter.organization,
-                    error=str(e),
-                )
-        return all_prs
+        prs = await self._fetch_from_adapters(
+            lambda adapter: adapter.fetch_pull_requests(creator_id="@me"),
+            "Failed to fetch authored PRs from adapter",
+        )
+        return [self._convert_pr(pr) for pr in prs]
 
     async def fetch_pending_review(self) -> list[CodeReview]:
         """Fetch PRs where the current user is a reviewer.
@@ -285,18 +305,11 @@ class AzureDevOpsSource(CodeReviewSource, PieceOfWorkSource, SetupCapableSource)
             "Fetching pending review Azure DevOps PRs",
             organizations=len(self._adapters),
         )
-        all_prs: list[CodeReview] = []
-        for adapter in self._adapters:
-            try:
-                prs = await adapter.fetch_pull_requests(reviewer_id="@me")
-                all_prs.extend([self._convert_pr(pr) for pr in prs])
-            except Exception as e:
-                logger.warning(
-                    "Failed to fetch pending review PRs from adapter",
-                    organization=adapter.organization,
-                    error=str(e),
-                )
-        return all_prs
+        prs = await self._fetch_from_adapters(
+            lambda adapter: adapter.fetch_pull_requests(reviewer_id="@me"),
+            "Failed to fetch pending review PRs from adapter",
+        )
+        return [self._convert_pr(pr) for pr in prs]
 
     async def fetch_items(self) -> list[PieceOfWork]:
         """Fetch work items assigned to the current user.
@@ -308,18 +321,10 @@ class AzureDevOpsSource(CodeReviewSource, PieceOfWorkSource, SetupCapableSource)
             "Fetching Azure DevOps work items",
             organizations=len(self._adapters),
         )
-        all_items: list[PieceOfWork] = []
-        for adapter in self._adapters:
-            try:
-                items = await adapter.fetch_work_items()
-                all_items.extend(items)
-            except Exception as e:
-                logger.warning(
-                    "Failed to fetch work items from adapter",
-                    organization=adapter.organization,
-                    error=str(e),
-                )
-        return all_items
+        return await self._fetch_from_adapters(
+            lambda adapter: adapter.fetch_work_items(),
+            "Failed to fetch work items from adapter",
+        )
 
     def _convert_pr(self, pr: AzureDevOpsPullRequest) -> CodeReview:
         """Convert AzureDevOpsPullRequest to CodeReview model.
@@ -5,6 +5,8 @@ Provides Source protocols and base implementations for CLI and API-based sources
 
 from __future__ import annotations
 
+import json
+import shutil
 import typing as t
 from abc import ABC
 from abc import abstractmethod
@@ -241,8 +243,6 @@ class CLIBaseAdapter(ABC):  # noqa: B024
 
     async def is_available(self) -> bool:
         """Check if the CLI is installed."""
-        import shutil
-
         if self._available is None:
             self._available = shutil.which(self.cli_name) is not None
         return self._available
@@ -255,8 +255,6 @@ class CLIBaseAdapter(ABC):  # noqa: B024
 
     async def fetch_json(self, args: list[str], **kwargs) -> list[dict] | dict:
         """Run CLI command and parse JSON output."""
-        import json
-
         stdout, _stderr = await self.run(args, **kwargs)
         if not stdout.strip():
             return []
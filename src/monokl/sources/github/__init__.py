@@ -13,6 +13,7 @@ from typing import TYPE_CHECKING
 
 from monokl import get_logger
 from monokl.models import CodeReview
+from monokl.models import GitHubPieceOfWork
 from monokl.models import PieceOfWork
 from monokl.sources.base import AdapterStatus
 from monokl.sources.base import CodeReviewSource
@@ -68,7 +69,7 @@ class GitHubSource(CodeReviewSource, PieceOfWorkSource, SetupCapableSource):
         return await self._adapter.check_auth()
 
     async def get_status(self) -> AdapterStatus:
-        installed = shutil.which("gh") is not None
+        installed = self._adapter.is_available()
         authenticated = False
         error_message = None
 
@@ -175,18 +176,19 @@ class GitHubSource(CodeReviewSource, PieceOfWorkSource, SetupCapableSource):
 
     def _convert_pr_to_code_review(self, pr: dict) -> CodeReview:
         """Convert a GitHub PR dict to a CodeReview model."""
-        author = pr.get("author", {}).get("login", "Unknown")
+        author = pr.get("author")
         created_at = None
-        if pr.get("createdAt"):
-            with suppress(ValueError, AttributeError):
-                created_at = datetime.fromisoformat(pr["createdAt"].replace("Z", "+00:00"))
+        if created_at_str := pr.get("createdAt"):
+            # fromisoformat accepts the trailing "Z" GitHub uses
+            with suppress(ValueError, TypeError):
+                created_at = datetime.fromisoformat(created_at_str)
 
         return CodeReview(
             id=str(pr["number"]),
             key=f"#{pr['number']}",
             title=pr["title"],
             state=pr.get("state", "open").lower(),
-            author=author,
+            author=author.get("login", "Unknown") if author else "Unknown",
             source_branch=pr.get("headRefName", ""),
             url=pr["url"],
             created_at=created_at,
@@ -197,8 +199,6 @@ class GitHubSource(CodeReviewSource, PieceOfWorkSource, SetupCapableSource):
 
     def _convert_issue_to_piece_of_work(self, issue: dict) -> PieceOfWork:
         """Convert a GitHub issue dict to a PieceOfWork model."""
-        from monokl.models import GitHubPieceOfWork
-
         return GitHubPieceOfWork(
             number=issue["number"],
             title=issue["title"],
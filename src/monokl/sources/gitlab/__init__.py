@@ -69,7 +69,7 @@ class GitLabSource(CodeReviewSource, SetupCapableSource):
         return await self._adapter.check_auth()
 
     async def get_status(self) -> AdapterStatus:
-        installed = shutil.which("glab") is not None
+        installed = self._adapter.is_available()
         authenticated = False
         error_message = None
 
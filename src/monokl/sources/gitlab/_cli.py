@@ -4,6 +4,8 @@ Provides GitLabAdapter class that uses glab CLI to fetch merge requests
 assigned to or authored by the current user.
 """
 
+import asyncio
+
 from monokl import get_logger
 from monokl.async_utils import CLIAdapter
 from monokl.async_utils import run_cli_command
@@ -37,6 +39,9 @@ class GitLabAdapter(CLIAdapter):
     def __init__(self) -> None:
         """Initialize GitLab adapter with cli_name='glab'."""
         super().__init__("glab")
+        # Shared probe for a GitLab git remote; remotes don't change while
+        # the app runs, so every MR query reuses the first answer
+        self._remote_check: asyncio.Task[bool] | None = None
 
     async def fetch_assigned_mrs(
         self,
@@ -84,7 +89,7 @@ class GitLabAdapter(CLIAdapter):
         """
         # Without an explicit group, glab relies on git remotes.
         # Skip fetch when the current repo has no GitLab remote to avoid noisy errors.
-        if not group and not await self._has_gitlab_remote():
+        if not group and not await self._check_gitlab_remote_once():
             logger.info("Skipping GitLab MR fetch: no group configured and no GitLab remote")
             return []
 
@@ -145,6 +150,16 @@ class GitLabAdapter(CLIAdapter):
             )
             raise
 
+    async def _check_gitlab_remote_once(self) -> bool:
+        """Check for a GitLab remote, spawning ``git remote`` at most once.
+
+        Concurrent callers (the assigned, authored and review queries are
+        fetched together) all await the same probe.
+        """
+        if self._remote_check is None:
+            self._remote_check = asyncio.ensure_future(self._has_gitlab_remote())
+        return await self._remote_check
+
     async def _has_gitlab_remote(self) -> bool:
         """Check whether current repository has at least one GitLab remote."""
         try:
@@ -67,7 +67,7 @@ class JiraSource(PieceOfWorkSource, SetupCapableSource):
         return await self._adapter.check_auth()
 
     async def get_status(self) -> AdapterStatus:
-        installed = shutil.which("acli") is not None
+        installed = self._adapter.is_available()
         authenticated = False
         error_message = None
 
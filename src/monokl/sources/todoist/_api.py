@@ -7,22 +7,21 @@ API calls directly.
 
 from __future__ import annotations
 
+import importlib.util
+import typing as t
 from datetime import UTC
 from datetime import datetime
 from datetime import timedelta
-from typing import Any
 
 from monokl.logging_config import get_logger
 
 from ...models import DueInfo
 from ...models import TodoistTask
 
-logger = get_logger(__name__)
-
-try:
+if t.TYPE_CHECKING:
     from todoist_api_python.api_async import TodoistAPIAsync
-except ImportError:
-    TodoistAPIAsync = None  # type: ignore[assignment,misc]
+
+logger = get_logger(__name__)
 
 
 class TodoistAdapter:
@@ -41,7 +40,9 @@ class TodoistAdapter:
         Raises:
             ImportError: If todoist-api-python is not installed
         """
-        if TodoistAPIAsync is None:
+        # Only check that the SDK is installed; importing it (and its HTTP
+        # stack) is deferred until the first API call
+        if importlib.util.find_spec("todoist_api_python") is None:
             raise ImportError(
                 "todoist-api-python is required for Todoist integration. "
                 "Install it with: uv add todoist-api-python"
@@ -57,6 +58,8 @@ class TodoistAdapter:
             Initialized TodoistAPIAsync client
         """
         if self._api is None:
+            from todoist_api_python.api_async import TodoistAPIAsync
+
             self._api = TodoistAPIAsync(self.token)  # type: ignore[call-arg]
         return self._api
 
@@ -92,7 +95,7 @@ class TodoistAdapter:
         """
         # 1. Get all projects to build name-to-ID mapping
         try:
-            projects_list: list[Any] = []
+            projects_list: list[t.Any] = []
             projects_gen = await self.api.get_projects()
             async for page in projects_gen:
                 # Page is a list of projects
@@ -117,7 +120,7 @@ class TodoistAdapter:
 
         # 3. Fetch active tasks
         try:
-            active_tasks: list[Any] = []
+            active_tasks: list[t.Any] = []
             tasks_gen = await self.api.get_tasks()
             async for page in tasks_gen:
                 # Page is a list of tasks
@@ -129,7 +132,7 @@ class TodoistAdapter:
         # 4. Optionally fetch completed tasks
         # NOTE: Completed tasks use a separate Sync API endpoint.
         # The SDK exposes this as get_completed_items(), NOT get_tasks(is_completed=True).
-        completed_tasks: list[Any] = []
+        completed_tasks: list[t.Any] = []
         if show_completed:
             try:
                 # get_completed_items may not exist in all SDK versions
@@ -152,30 +155,30 @@ class TodoistAdapter:
         # 5. Convert to models with filtering
         all_tasks = active_tasks + completed_tasks
         tasks = []
-        for t in all_tasks:
+        for task in all_tasks:
             # Filter by project if specified
-            if target_project_ids and t.project_id not in target_project_ids:
+            if target_project_ids and task.project_id not in target_project_ids:
                 continue
 
             # Filter completed by time window if specified
             if (
-                t.is_completed
+                task.is_completed
                 and show_completed_for_last
                 and not self._is_within_timeframe(
-                    t.completed_at,
+                    task.completed_at,
                     show_completed_for_last,
                 )
             ):
                 continue
 
-            tasks.append(self._task_to_model(t, project_id_to_name))
+            tasks.append(self._task_to_model(task, project_id_to_name))
 
         logger.info("Fetched Todoist tasks", count=len(tasks))
         return tasks
 
     def _task_to_model(
         self,
-        task: Any,  # Task from SDK
+        task: t.Any,  # Task from SDK
         project_id_to_name: dict[str, str],
     ) -> TodoistTask:
         """Convert SDK Task to TodoistTask model.
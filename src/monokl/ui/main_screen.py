@@ -15,6 +15,9 @@ Features:
 from __future__ import annotations
 
 import asyncio
+import time
+import typing as t
+import webbrowser
 
 from textual.app import ComposeResult
 from textual.binding import Binding
@@ -31,7 +34,26 @@ from monokl.db.preferences import PreferencesManager
 from monokl.ui.sections import CodeReviewSection
 from monokl.ui.sections import PieceOfWorkSection
 from monokl.ui.sections import SectionClicked
+from monokl.ui.sorting import sort_open_first
 from monokl.ui.topbar import TopBar
+from monokl.ui.work_store_factory import create_work_store
+
+if t.TYPE_CHECKING:
+    from textual.timer import Timer
+
+logger = get_logger(__name__)
+
+# Delay before persisting UI state, so bursts of reactive changes
+# (e.g. Tab flipping both section and subsection) result in one write
+SAVE_UI_STATE_DELAY = 0.2
+
+# Minimum interval between manual refreshes, so a held 'r' key does not
+# launch a burst of overlapping CLI fetches
+REFRESH_DEBOUNCE = 0.5
+
+# Upper bound on a background fetch, so a hung CLI cannot leave a section
+# spinning forever
+FETCH_TIMEOUT = 30.0
 
 
 class MainScreen(Screen):
@@ -56,8 +78,6 @@ class MainScreen(Screen):
 
     active_section: reactive[str] = reactive("mr", bindings=True)
     active_mr_subsection: reactive[str] = reactive("assigned")
-    mr_loading: reactive[bool] = reactive(False)
-    work_loading: reactive[bool] = reactive(False)
     mr_offline: reactive[bool] = reactive(False)
     work_offline: reactive[bool] = reactive(False)
 
@@ -67,11 +87,6 @@ class MainScreen(Screen):
         layout: vertical;
     }
 
-    /* Slim scrollbars throughout the app */
-    * {
-        scrollbar-size: 1 1;
-    }
-
     #mr-container {
         height: 50%;
         padding: 0;
@@ -93,41 +108,10 @@ class MainScreen(Screen):
         border: round $warning;
     }
 
-    .offline-indicator {
-        text-style: bold;
-        color: $warning;
-    }
-
     #sections-container {
         height: 1fr;
     }
 
-    #content {
-        height: 1fr;
-    }
-
-    #spinner-container {
-        display: none;
-        height: 100%;
-        width: 100%;
-        content-align: center middle;
-    }
-
-    #spinner-container LoadingIndicator {
-        width: auto;
-        height: auto;
-    }
-
-    #message {
-        height: 100%;
-        width: 100%;
-        content-align: center middle;
-    }
-
-    #data-table {
-        height: 100%;
-    }
-
     Footer {
         background: $surface-darken-2;
         color: $text;
@@ -135,6 +119,16 @@ class MainScreen(Screen):
     }
     """
 
+    def __init__(self, *args: object, **kwargs: object) -> None:
+        """Initialize the main screen."""
+        super().__init__(*args, **kwargs)
+        self._save_timer: Timer | None = None
+        self._last_refresh_at = float("-inf")
+        # Plain flags rather than reactives: nothing watches them, so the
+        # reactive machinery would only add overhead to every fetch
+        self.mr_loading = False
+        self.work_loading = False
+
     def compose(self) -> ComposeResult:
         """Compose the main screen with two sections."""
         with Vertical(id="sections-container"):
@@ -144,7 +138,8 @@ class MainScreen(Screen):
                 self.code_review_section = CodeReviewSection()
                 yield self.code_review_section
 
-            with Vertical(id="work-container"):
+            self._work_container = Vertical(id="work-container")
+            with self._work_container:
                 self.piece_of_work_section = PieceOfWorkSection()
                 yield self.piece_of_work_section
 
@@ -154,53 +149,76 @@ class MainScreen(Screen):
         """Handle mount event - initialize database and load data.
 
         Flow:
-        1. Initialize database
-        2. Load cached data from DB immediately (for fast startup)
-        3. Start background worker to fetch fresh data from CLIs
+        1. Set up the config and sources, then initialize the database
+        2. Restore UI state and load cached data from DB concurrently
+        3. Start background worker to fetch fresh data from CLIs, skipping
+           sections whose cached data is still fresh
         """
-        # Initialize database
-        db = get_db_manager()
-        await db.initialize()
+        # Resolve the default browser off the event loop so the first 'o'
+        # press doesn't pay for probing the platform's browser registry
+        self.run_worker(
+            webbrowser.get,
+            name="prewarm-browser",
+            group="prewarm-browser",
+            thread=True,
+            exit_on_error=False,
+        )
 
-        # Initialize work store and preferences
-        from monokl.ui.work_store_factory import create_work_store
+        # Set before any data loads so the offline watcher can amend it
+        self._work_container.border_title = "[2] Work Items"
 
-        config = get_config()
-        self._store = create_work_store(config)
+        # Initialize work store and preferences
+        self._config = get_config()
+        # Read once: the offline flag comes from the environment, which doesn't
+        # change while the app runs
+        self._offline_mode = self._config.offline_mode
+        self._store = create_work_store(self._config)
         self._prefs = PreferencesManager()
         self._source_errors: dict[str, str] = {}  # Track failed sources for UI warnings
 
-        # Restore UI state from preferences
-        await self._restore_ui_state()
-
-        # Step 1: Load cached data from DB immediately for fast startup
-        await self._load_cached_data()
+        # Only once the synchronous setup has succeeded, so a config error
+        # can't leave an initialization task behind that nobody awaits
+        await get_db_manager().initialize()
 
-        # Step 2: Start background fetch from CLIs (unless offline mode)
-        if not config.offline_mode:
-            self.run_worker(self._fetch_all_data_from_clis(), exclusive=True)
-
-        # Set border titles
-        self.query_one("#work-container").border_title = "[2] Work Items"
+        # Step 1: Restore UI state and load cached data from DB concurrently
+        # for fast startup (both only read local state)
+        restored, cached = await asyncio.gather(
+            self._restore_ui_state(),
+            self._load_cached_data(),
+            return_exceptions=True,
+        )
+        if isinstance(restored, Exception):
+            logger.warning("Failed to restore UI state", error=str(restored))
+        mr_fresh, work_fresh = (False, False) if isinstance(cached, Exception) else cached
+
+        # Step 2: Start background fetch from CLIs for anything not already
+        # fresh (unless offline mode)
+        if not self._offline_mode and not (mr_fresh and work_fresh):
+            self.run_worker(
+                self._fetch_all_data_from_clis(
+                    code_reviews=not mr_fresh,
+                    work_items=not work_fresh,
+                ),
+            )
 
     async def _restore_ui_state(self) -> None:
-        """Restore last active section and sort preferences from preferences."""
-        try:
-            self.active_section = await self._prefs.get_last_active_section("mr")
-            self.active_mr_subsection = await self._prefs.get_last_mr_subsection("assigned")
+        """Restore last active section and sort preferences from preferences.
 
-            # Update UI to reflect restored state
-            self.code_review_section.focus_section(self.active_mr_subsection)
-            if self.active_section == "work":
-                self.piece_of_work_section.focus_table()
+        PreferencesManager logs and swallows storage errors, returning the
+        defaults instead. Anything else raised here propagates, and
+        on_mount, the only caller, logs it and keeps the defaults.
+        """
+        section, subsection = await self._prefs.get_ui_state("mr", "assigned")
+        self._set_active(section, subsection)
 
-            # Restore sort preferences if enabled
-            config = get_config()
-            if config.preserve_sort_preference:
-                await self._restore_sort_preferences()
-        except Exception:
-            # Ignore errors restoring state
-            pass
+        # Update UI to reflect restored state
+        self.code_review_section.focus_section(self.active_mr_subsection)
+        if self.active_section == "work":
+            self.piece_of_work_section.focus_table()
+
+        # Restore sort preferences if enabled
+        if self._config.preserve_sort_preference:
+            await self._restore_sort_preferences()
 
     async def _restore_sort_preferences(self) -> None:
         """Restore sort preferences for all sections."""
@@ -215,19 +233,39 @@ class MainScreen(Screen):
             if sort_dict:
                 section.restore_sort_state(sort_dict)
 
-    async def _save_ui_state(self) -> None:
-        """Save current UI state to preferences."""
+    def _schedule_save(self) -> None:
+        """Schedule a debounced save of the UI state.
+
+        Restarts the pending timer on every call, so several reactive
+        changes in quick succession are persisted with a single write.
+        """
+        if self._save_timer is not None:
+            self._save_timer.stop()
+        self._save_timer = self.set_timer(SAVE_UI_STATE_DELAY, self._save_scheduled_ui_state)
+
+    async def _save_scheduled_ui_state(self) -> None:
+        """Persist the UI state once the debounce timer fires, or on quit.
+
+        A failed write is logged rather than raised, so it neither crashes
+        the app nor keeps later changes from being saved, or the app from exiting.
+        """
+        self._save_timer = None
         try:
-            await self._prefs.set_last_active_section(self.active_section)
-            await self._prefs.set_last_mr_subsection(self.active_mr_subsection)
+            await self._save_ui_state()
+        except Exception as e:
+            logger.warning("Failed to save UI state", error=str(e))
+
+    async def _save_ui_state(self) -> None:
+        """Save current UI state to preferences.
 
-            # Save sort preferences if enabled
-            config = get_config()
-            if config.preserve_sort_preference:
-                await self._save_sort_preferences()
-        except Exception:
-            # Ignore errors saving state
-            pass
+        Errors propagate; call this through _save_scheduled_ui_state, which
+        logs them.
+        """
+        await self._prefs.set_ui_state(self.active_section, self.active_mr_subsection)
+
+        # Save sort preferences if enabled
+        if self._config.preserve_sort_preference:
+            await self._save_sort_preferences()
 
     async def _save_sort_preferences(self) -> None:
         """Save sort preferences for all sections."""
@@ -242,56 +280,90 @@ class MainScreen(Screen):
             if sort_dict:
                 await self._prefs.set_sort_preference(section_id, sort_dict)
 
-    async def _load_cached_data(self) -> None:
+    async def _load_cached_data(self) -> tuple[bool, bool]:
         """Load cached data from database for immediate display.
 
         This provides fast startup by showing cached data immediately,
-        while fresh data is fetched in the background.
+        while fresh data is fetched in the background. Stale cache entries
+        don't trigger the store's own background refresh, since on_mount
+        already schedules a fetch for any section that isn't fresh. Nothing
+        is fetched here: with a cold cache that fetch, bounded by
+        FETCH_TIMEOUT, is what fills the sections.
+
+        Returns:
+            Whether the code reviews and the work items shown are fresh.
         """
-        logger = get_logger(__name__)
         logger.info("Loading cached data from database")
 
-        await self._load_code_reviews_cached(logger)
-        await self._load_work_items_cached(logger)
+        mr_fresh, work_fresh = await asyncio.gather(
+            self._load_code_reviews_cached(),
+            self._load_work_items_cached(),
+        )
+        return mr_fresh, work_fresh
+
+    async def _load_code_reviews_cached(self) -> bool:
+        """Load cached code reviews and update UI.
 
-    async def _load_code_reviews_cached(self, logger) -> None:
-        """Load cached code reviews and update UI."""
+        Returns:
+            True if every source's cached code reviews are fresh, so the startup fetch
+            can be skipped.
+        """
         try:
-            await self._load_assigned_reviews(logger)
-            await self._load_opened_reviews(logger)
-            self.mr_offline = not await self._store.is_fresh("code_reviews")
+            # The freshness checks are independent reads, so overlap them with the data read
+            results, is_fresh, all_fresh = await asyncio.gather(
+                self._store.get_code_reviews_bulk(
+                    ["assigned", "opened"], refresh_stale=False, fetch_missing=False
+                ),
+                self._store.is_fresh("code_reviews"),
+                self._store.is_fresh("code_reviews", all_sources=True),
+            )
+            result_assigned = results["assigned"]
+            result_opened = results["opened"]
+
+            # With nothing cached the spinner stays up for the fetch that follows
+            if result_assigned.data or result_opened.data or is_fresh or self._offline_mode:
+                self.code_review_section.update_all(result_assigned.data, result_opened.data)
+            logger.debug(
+                "Loaded cached code reviews",
+                assigned=len(result_assigned.data),
+                opened=len(result_opened.data),
+            )
+            self._track_failed_sources(result_assigned)
+            self._track_failed_sources(result_opened)
+
+            self.mr_offline = not (is_fresh or result_assigned.fresh or result_opened.fresh)
         except Exception as e:
             logger.warning("Failed to load cached code reviews", error=str(e))
+            return False
+        return all_fresh
+
+    async def _load_work_items_cached(self) -> bool:
+        """Load cached work items and update UI.
 
-    async def _load_assigned_reviews(self, logger) -> None:
-        """Load assigned reviews from cache."""
-        result = await self._store.get_code_reviews("assigned")
-        self.code_review_section.update_assigned_to_me(result.data)
-        logger.debug(f"Loaded {len(result.data)} assigned code reviews")
-        self._track_failed_sources(result)
-
-    async def _load_opened_reviews(self, logger) -> None:
-        """Load opened reviews from cache."""
-        result = await self._store.get_code_reviews("opened")
-        self.code_review_section.update_opened_by_me(result.data)
-        logger.debug(f"Loaded {len(result.data)} opened code reviews")
-        self._track_failed_sources(result)
-
-    async def _load_work_items_cached(self, logger) -> None:
-        """Load cached work items and update UI."""
+        Returns:
+            True if every source's cached work items are fresh, so the startup fetch can
+            be skipped.
+        """
         try:
-            result = await self._store.get_work_items()
-            self.piece_of_work_section.update_data(result.data)
-            logger.debug(f"Loaded {len(result.data)} work items")
+            result, is_fresh, all_fresh = await asyncio.gather(
+                self._store.get_work_items(refresh_stale=False, fetch_missing=False),
+                self._store.is_fresh("work_items"),
+                self._store.is_fresh("work_items", all_sources=True),
+            )
+            if result.data or is_fresh or self._offline_mode:
+                self.piece_of_work_section.update_data(result.data)
+            logger.debug("Loaded cached work items", count=len(result.data))
             self._track_failed_sources(result)
-            self.work_offline = not await self._store.is_fresh("work_items")
+            self.work_offline = not (is_fresh or result.fresh)
             self._update_work_subtitle()
         except Exception as e:
             logger.warning("Failed to load cached work items", error=str(e))
+            return False
+        return all_fresh
 
     def _update_work_subtitle(self) -> None:
         """Update work container subtitle with adapter icons."""
-        work_container = self.query_one("#work-container", Vertical)
+        work_container = self._work_container
         adapters = self.piece_of_work_section.get_adapter_info()
         if adapters:
             work_container.border_subtitle = ", ".join(f"{icon} {name}" for icon, name in adapters)
@@ -300,102 +372,147 @@ class MainScreen(Screen):
 
     def _track_failed_sources(self, result) -> None:
         """Track failed sources for UI warnings."""
-        for source in result.failed_sources:
-            self._source_errors[source] = result.errors.get(source, "Unknown error")
+        self._source_errors.update(
+            {source: result.errors.get(source, "Unknown error") for source in result.failed_sources}
+        )
 
-    async def _fetch_all_data_from_clis(self) -> None:
+    async def _fetch_all_data_from_clis(
+        self, *, code_reviews: bool = True, work_items: bool = True
+    ) -> None:
         """Fetch fresh data from CLI sources in the background.
 
-        Uses asyncio.gather() to run fetches in parallel.
-        Updates the UI with fresh data when complete.
+        Runs fetches in parallel. Each fetch updates its own section as soon
+        as it finishes, so the faster source is rendered while the slower one
+        keeps spinning. Fetches still running after FETCH_TIMEOUT seconds are
+        cancelled and their section is marked offline.
+
+        Args:
+            code_reviews: Whether to fetch code reviews.
+            work_items: Whether to fetch work items.
         """
-        logger = get_logger(__name__)
         logger.info("Starting background fetch from CLI sources")
 
-        await asyncio.gather(
-            self.fetch_code_reviews(),
-            self.fetch_work_items(),
-            return_exceptions=True,
-        )
+        fetches: dict[asyncio.Task[None], str] = {}
+        if code_reviews:
+            fetches[asyncio.create_task(self.fetch_code_reviews())] = "code_reviews"
+        if work_items:
+            fetches[asyncio.create_task(self.fetch_work_items())] = "work_items"
+        if not fetches:
+            return
+
+        try:
+            done, pending = await asyncio.wait(fetches, timeout=FETCH_TIMEOUT)
+        except asyncio.CancelledError:
+            # The worker was cancelled (e.g. the screen closed); don't leave orphans behind
+            for task in fetches:
+                task.cancel()
+            raise
+
+        for task in done:
+            if not task.cancelled() and (error := task.exception()) is not None:
+                logger.error("Background fetch failed", fetch=fetches[task], error=str(error))
+
+        if pending:
+            for task in pending:
+                task.cancel()
+            # Let the cancelled fetches run their cleanup before touching the UI
+            await asyncio.gather(*pending, return_exceptions=True)
+
+            self._mark_timed_out(sorted(fetches[task] for task in pending))
 
         logger.info("Background fetch from CLI sources complete")
 
-    async def fetch_code_reviews(self) -> None:
+    def _mark_timed_out(self, timed_out: list[str]) -> None:
+        """Mark the sections of timed out fetches as offline.
+
+        Rows already on screen (e.g. loaded from the cache) are kept; only a
+        section with nothing to show gets the timeout error.
+
+        Args:
+            timed_out: Names of the fetches that timed out.
+        """
+        logger.warning("Background fetch timed out", fetches=timed_out, timeout=FETCH_TIMEOUT)
+        if "code_reviews" in timed_out:
+            self.mr_offline = True
+            self.code_review_section.set_error("Timed out fetching code reviews", keep_data=True)
+        if "work_items" in timed_out:
+            self.work_offline = True
+            self.piece_of_work_section.set_error("Timed out fetching work items", keep_data=True)
+
+    async def fetch_code_reviews(self, *, offline: bool = False) -> None:
         """Fetch fresh code reviews from all registered CLI sources.
 
         This method fetches fresh data from CLI sources and updates the UI.
         Cached data is loaded separately in _load_cached_data() for fast startup.
         Falls back to stale cache if API fails.
-        """
-        fetch_logger = get_logger(__name__)
-
-        config = get_config()
 
-        # Skip if offline mode is enabled
-        if config.offline_mode:
-            fetch_logger.info("Offline mode enabled, skipping CLI fetch for code reviews")
+        Args:
+            offline: If True, skip the fetch (offline mode is enabled).
+        """
+        if offline:
+            logger.info("Offline mode enabled, skipping CLI fetch for code reviews")
+            return
+        if self.mr_loading:
+            # A fetch is already running and will paint fresh data when done
+            logger.debug("Code review fetch already in progress, skipping")
             return
 
         # Fetch fresh data from CLIs
         self.mr_loading = True
-        self.code_review_section.show_loading("Fetching code reviews...")
+        # Cached rows stay on screen while the refresh runs
+        self.code_review_section.show_loading("Fetching code reviews...", keep_data=True)
 
         try:
-            # Fetch assigned reviews with force_refresh
-            result_assigned = await self._store.get_code_reviews("assigned", force_refresh=True)
-            self.code_review_section.update_assigned_to_me(result_assigned.data)
-
-            # Track failed sources for UI
-            if result_assigned.failed_sources:
-                for source in result_assigned.failed_sources:
-                    self._source_errors[source] = result_assigned.errors.get(
-                        source, "Unknown error"
-                    )
-
-            # Fetch opened reviews with force_refresh
-            result_opened = await self._store.get_code_reviews("opened", force_refresh=True)
-            self.code_review_section.update_opened_by_me(result_opened.data)
-
-            # Track failed sources
-            if result_opened.failed_sources:
-                for source in result_opened.failed_sources:
-                    self._source_errors[source] = result_opened.errors.get(source, "Unknown error")
+            # Fetch assigned and opened reviews concurrently with force_refresh
+            results = await self._store.get_code_reviews_bulk(
+                ["assigned", "opened"], force_refresh=True
+            )
+            result_assigned = results["assigned"]
+            result_opened = results["opened"]
+
+            self.code_review_section.update_all(result_assigned.data, result_opened.data)
+
+            self._track_failed_sources(result_assigned)
+            self._track_failed_sources(result_opened)
 
             # Mark as online (not offline) if we got fresh data
             self.mr_offline = not (result_assigned.fresh or result_opened.fresh)
 
-            fetch_logger.info(
+            logger.info(
                 "Fetched code reviews",
                 assigned=len(result_assigned.data),
                 opened=len(result_opened.data),
-                failed_sources=result_assigned.failed_sources + result_opened.failed_sources,
+                failed_assigned=result_assigned.failed_sources,
+                failed_opened=result_opened.failed_sources,
             )
 
         except Exception as e:
-            fetch_logger.error("Failed to fetch code reviews", error=str(e))
+            logger.error("Failed to fetch code reviews", error=str(e))
             self.code_review_section.set_error(str(e))
         finally:
             self.mr_loading = False
 
-    async def fetch_work_items(self) -> None:
+    async def fetch_work_items(self, *, offline: bool = False) -> None:
         """Fetch fresh work items from all registered CLI sources.
 
         This method fetches fresh data from CLI sources and updates the UI.
         Cached data is loaded separately in _load_cached_data() for fast startup.
         Falls back to stale cache if APIs fail.
-        """
-        fetch_logger = get_logger(__name__)
 
-        config = get_config()
-
-        # Skip if offline mode is enabled
-        if config.offline_mode:
-            fetch_logger.info("Offline mode enabled, skipping CLI fetch for work items")
+        Args:
+            offline: If True, skip the fetch (offline mode is enabled).
+        """
+        if offline:
+            logger.info("Offline mode enabled, skipping CLI fetch for work items")
+            return
+        if self.work_loading:
+            logger.debug("Work item fetch already in progress, skipping")
             return
 
         # Fetch fresh data from CLIs
         self.work_loading = True
-        self.piece_of_work_section.show_loading("Fetching work items...")
+        # Cached rows stay on screen while the refresh runs
+        self.piece_of_work_section.show_loading("Fetching work items...", keep_data=True)
 
         try:
             # Fetch work items with force_refresh
@@ -404,91 +521,69 @@ class MainScreen(Screen):
             # Update the UI
             if result.data:
                 # Sort: open items first, then by display key for stability
-                items = sorted(result.data, key=lambda i: (not i.is_open(), i.display_key()))
-                self.piece_of_work_section.update_data(items)
+                self.piece_of_work_section.update_data(sort_open_first(result.data))
             else:
                 self.piece_of_work_section.set_error("No work items found")
 
-            # Track failed sources for UI
-            if result.failed_sources:
-                for source in result.failed_sources:
-                    self._source_errors[source] = result.errors.get(source, "Unknown error")
+            self._track_failed_sources(result)
 
             # Mark as online (not offline) if we got fresh data
             self.work_offline = not result.fresh
             self._update_work_subtitle()
 
-            fetch_logger.info(
+            logger.info(
                 "Fetched work items",
                 count=len(result.data),
                 failed_sources=result.failed_sources,
             )
 
         except Exception as e:
-            fetch_logger.error("Failed to fetch work items", error=str(e))
+            logger.error("Failed to fetch work items", error=str(e))
             self.piece_of_work_section.set_error(str(e))
         finally:
             self.work_loading = False
 
     def watch_active_section(self) -> None:
         """Update visual indicators when active section changes."""
-        work_container = self.query_one("#work-container", Vertical)
-        assigned_section = self.code_review_section.assigned_to_me_section
-        opened_section = self.code_review_section.opened_by_me_section
-
-        assigned_section.remove_class("active")
-        opened_section.remove_class("active")
-        work_container.remove_class("active")
-
-        if self.active_section == "mr":
-            if self.active_mr_subsection == "assigned":
-                assigned_section.add_class("active")
-            else:
-                opened_section.add_class("active")
-        else:
-            work_container.add_class("active")
-
-        # Save UI state
-        self.run_worker(self._save_ui_state(), exclusive=True)
+        self._update_active_classes()
+        self._schedule_save()
 
     def watch_active_mr_subsection(self) -> None:
         """Update visual indicators when MR subsection changes."""
         if self.active_section != "mr":
             return
 
-        assigned_section = self.code_review_section.assigned_to_me_section
-        opened_section = self.code_review_section.opened_by_me_section
+        self._update_active_classes()
+        self._schedule_save()
 
-        assigned_section.remove_class("active")
-        opened_section.remove_class("active")
+    def _update_active_classes(self) -> None:
+        """Mark only the focused section as active.
 
-        if self.active_mr_subsection == "assigned":
-            assigned_section.add_class("active")
-        else:
-            opened_section.add_class("active")
+        ``set_class`` leaves a widget untouched when its class is already in
+        the requested state, so only the widgets whose highlight actually
+        changes get their styles recomputed.
+        """
+        in_mr = self.active_section == "mr"
+        self.code_review_section.assigned_to_me_section.set_class(
+            in_mr and self.active_mr_subsection == "assigned", "active"
+        )
+        self.code_review_section.opened_by_me_section.set_class(
+            in_mr and self.active_mr_subsection != "assigned", "active"
+        )
+        self._work_container.set_class(not in_mr, "active")
 
     def watch_mr_offline(self) -> None:
         """Update visual indicator for offline/cached data."""
-        assigned_section = self.code_review_section.assigned_to_me_section
-        opened_section = self.code_review_section.opened_by_me_section
-
-        if self.mr_offline:
-            assigned_section.add_class("offline")
-            opened_section.add_class("offline")
-        else:
-            assigned_section.remove_class("offline")
-            opened_section.remove_class("offline")
+        self.code_review_section.assigned_to_me_section.set_class(self.mr_offline, "offline")
+        self.code_review_section.opened_by_me_section.set_class(self.mr_offline, "offline")
 
     def watch_work_offline(self) -> None:
         """Update visual indicator for offline/cached data."""
-        work_container = self.query_one("#work-container", Vertical)
-
-        if self.work_offline:
-            work_container.add_class("offline")
-            work_container.border_title = "[2] Work Items (offline)"
-        else:
-            work_container.remove_class("offline")
-            work_container.border_title = "[2] Work Items"
+        work_container = self._work_container
+        work_container.set_class(self.work_offline, "offline")
+        work_container.border_title = (
+            "[2] Work Items (offline)" if self.work_offline else "[2] Work Items"
+        )
 
     def switch_section(self) -> None:
         """Switch between MR and Work sections.
@@ -507,8 +602,7 @@ class MainScreen(Screen):
                 self.piece_of_work_section.focus_table()
         else:
             # From Work section, go back to MR "Assigned to me"
-            self.active_section = "mr"
-            self.active_mr_subsection = "assigned"
+            self._set_active("mr", "assigned")
             self.code_review_section.focus_section("assigned")
 
     def action_switch_section(self) -> None:
@@ -517,41 +611,62 @@ class MainScreen(Screen):
 
     def on_section_clicked(self, event: SectionClicked) -> None:
         """Handle section click to update active section state."""
-        self.active_section = event.section_type
-        if event.section_type == "mr" and event.subsection:
-            self.active_mr_subsection = event.subsection
+        subsection = event.subsection if event.section_type == "mr" else None
+        self._set_active(event.section_type, subsection or None)
+
+    def _set_active(self, section: str, subsection: str | None = None) -> None:
+        """Move the focus to a section, and optionally an MR subsection.
+
+        When both values change, the subsection is set without invoking its
+        watcher: the section watcher refreshes the highlight for both, so the
+        transition costs one watcher pass instead of two.
+
+        Args:
+            section: Section to make active ("mr" or "work").
+            subsection: MR subsection to make active, or None to keep it.
+        """
+        if subsection is not None:
+            if section == self.active_section:
+                self.active_mr_subsection = subsection
+                return
+            self.set_reactive(MainScreen.active_mr_subsection, subsection)
+        self.active_section = section
 
     def action_refresh(self) -> None:
         """Action handler to manually refresh data.
 
-        Invalidates the cache for the current section and fetches fresh data.
+        Fetches fresh data for the current section. The fetch overwrites each
+        source's cache entry, so the cache is not invalidated first and the
+        previous data stays available as a fallback if the fetch fails.
+        Presses arriving within REFRESH_DEBOUNCE of the previous refresh are
+        ignored, and so are presses while the section's fetch is still
+        running, rather than cancelling and restarting it.
         """
+        now = time.monotonic()
+        if now - self._last_refresh_at < REFRESH_DEBOUNCE:
+            return
+        self._last_refresh_at = now
+
         if self.active_section == "mr":
-            self.run_worker(self._refresh_merge_requests(), exclusive=True)
+            self.run_worker(self.fetch_code_reviews(offline=self._offline_mode))
         else:
-            self.run_worker(self._refresh_work_items(), exclusive=True)
-
-    async def _refresh_merge_requests(self) -> None:
-        """Refresh merge requests (invalidate cache first)."""
-        await self._store.invalidate(data_type="code_reviews")
-        await self.fetch_code_reviews()
-
-    async def _refresh_work_items(self) -> None:
-        """Refresh work items (invalidate cache first)."""
-        await self._store.invalidate(data_type="work_items")
-        await self.fetch_work_items()
-
-    def action_quit(self) -> None:
-        """Quit the application."""
+            self.run_worker(self.fetch_work_items(offline=self._offline_mode))
+
+    async def action_quit(self) -> None:
+        """Quit the application, flushing any pending UI state save first."""
+        if self._save_timer is not None:
+            # Write the pending save now rather than waiting out the debounce delay
+            self._save_timer.stop()
+            await self._save_scheduled_ui_state()
         self.app.exit()
 
-    def on_key(self, event) -> None:
-        """Handle key events for navigation.
-
-        This method handles key events directly for cases where
-        the standard BINDINGS mechanism needs supplementary handling.
-        Currently delegates to action handlers for consistency.
+    def on_unmount(self) -> None:
+        """Stop the pending UI state save and any in-flight fetches.
 
-        Args:
-            event: The key event from Textual.
+        Cancelling the fetch workers cancels their CLI calls, which kill
+        and reap their subprocesses instead of leaving them running after
+        the screen is gone.
         """
+        if self._save_timer is not None:
+            self._save_timer.stop()
+        self.workers.cancel_node(self)
@@ -7,8 +7,8 @@ to display merge requests and work items with loading, empty, and error states.
 from __future__ import annotations
 
 import webbrowser
-from contextlib import suppress
 from datetime import datetime
+from functools import partial
 from typing import TYPE_CHECKING
 from typing import Any
 
@@ -26,7 +26,9 @@ from textual.widgets import Static
 from monokl.ui.sorting import SORT_INDICATOR_NONE
 from monokl.ui.sorting import SortMethod
 from monokl.ui.sorting import SortState
+from monokl.ui.sorting import get_code_review_sort_key
 from monokl.ui.sorting import get_sort_indicator
+from monokl.ui.sorting import get_work_item_sort_key
 from monokl.ui.spinner import StatusSpinner
 
 if TYPE_CHECKING:
@@ -43,6 +45,15 @@ class SectionState:
     DATA = "data"
 
 
+# Display values of the spinner row, data table and message label per state
+_STATE_DISPLAY: dict[str, tuple[str, str, str]] = {
+    SectionState.LOADING: ("block", "none", "none"),
+    SectionState.EMPTY: ("none", "none", "block"),
+    SectionState.ERROR: ("none", "none", "block"),
+    SectionState.DATA: ("none", "block", "none"),
+}
+
+
 class SectionClicked(Message):
     """Message posted when a section is clicked."""
 
@@ -133,15 +144,26 @@ class BaseSection(Static):
         super().__init__(*args, **kwargs)
         self.section_title = title
         self._data_table: DataTable[str] | None = None
+        self._item_count = 0
+        # Row key -> cell values currently in the table, in display order
+        self._rendered_rows: dict[str, tuple[str, ...]] = {}
+        # Row keys by row index, for O(1) lookup of the selected row
+        self._row_keys: list[str] = []
+        # Whether a refresh is running behind the rows already displayed
+        self._refreshing = False
 
     def compose(self) -> ComposeResult:
         """Compose the section layout."""
+        # Keep references to the widgets toggled on every state change
+        self._message = Label("", id="message")
+        self._spinner_row = Horizontal(id="spinner-row")
+        self._spinner = StatusSpinner("", id="spinner")
         with Vertical(), Vertical(id="content"):
             with Vertical(id="content-wrapper"):
                 yield DataTable[str](id="data-table")
-                yield Label("", id="message")
-            with Horizontal(id="spinner-row"):
-                yield StatusSpinner("", id="spinner")
+                yield self._message
+            with self._spinner_row:
+                yield self._spinner
 
     def on_mount(self) -> None:
         """Handle mount event."""
@@ -154,58 +176,187 @@ class BaseSection(Static):
 
     def _update_visibility(self) -> None:
         """Update widget visibility based on current state."""
-        spinner = self.query_one("#spinner", StatusSpinner)
-        spinner_row = self.query_one("#spinner-row", Horizontal)
-        table = self.query_one("#data-table", DataTable)
-        message = self.query_one("#message", Label)
-
-        if self.state == SectionState.LOADING:
-            spinner_row.styles.display = "block"
-            spinner.start(self.loading_status)
-            table.styles.display = "none"
-            message.styles.display = "none"
-        elif self.state == SectionState.EMPTY:
-            spinner_row.styles.display = "none"
-            spinner.stop()
-            table.styles.display = "none"
-            message.styles.display = "block"
+        table = self._data_table
+        if table is None:
+            # Not mounted yet; on_mount applies the current state
+            return
+        state = self.state
+        message = self._message
+
+        spinner_display, table_display, message_display = _STATE_DISPLAY.get(
+            state, _STATE_DISPLAY[SectionState.DATA]
+        )
+        # A refresh behind displayed rows shows the spinner row below them
+        refreshing = self._refreshing and state == SectionState.DATA
+        self._spinner_row.styles.display = "block" if refreshing else spinner_display
+        table.styles.display = table_display
+        message.styles.display = message_display
+
+        if state == SectionState.LOADING or refreshing:
+            self._spinner.start(self.loading_status)
+        else:
+            self._spinner.stop()
+
+        if state == SectionState.EMPTY:
             message.update(self._get_empty_message())
-        elif self.state == SectionState.ERROR:
-            spinner_row.styles.display = "none"
-            spinner.stop()
-            table.styles.display = "none"
-            message.styles.display = "block"
+        elif state == SectionState.ERROR:
             message.update(f"Error: {self.error_message}")
-            message.add_class("error")
-        else:  # DATA state
-            spinner_row.styles.display = "none"
-            spinner.stop()
-            table.styles.display = "block"
-            message.styles.display = "none"
+        # Only touches the classes when entering or leaving the error state
+        message.set_class(state == SectionState.ERROR, "error")
 
     def _get_empty_message(self) -> str:
         """Get the empty state message. Override in subclasses."""
         return "No items found"
 
-    def show_loading(self, status: str = "") -> None:
+    def _is_already_rendered(self, rows: dict[str, tuple[str, ...]]) -> bool:
+        """Check whether the table already shows exactly these rows.
+
+        When it does, the data/empty state is restored so a pending loading
+        spinner is cleared without rebuilding the table. Row order is not
+        compared, so unchanged data doesn't undo a sort the user applied.
+
+        Args:
+            rows: The formatted rows about to be rendered.
+
+        Returns:
+            True if the rows are unchanged and rendering can be skipped.
+        """
+        if self._data_table is None or rows != self._rendered_rows:
+            return False
+
+        self.state = SectionState.DATA if self._data_table.row_count else SectionState.EMPTY
+        return True
+
+    def _render_rows(self, rows: dict[str, tuple[str, ...]]) -> None:
+        """Show rows in the table, changing as little of it as possible.
+
+        When the rows still in the table keep their relative order, rows that
+        disappeared are removed, changed cells are updated in place and new
+        rows are appended, which also keeps the cursor where the user left
+        it. Otherwise the table is rebuilt. Either way the screen is updated
+        once.
+
+        Args:
+            rows: Cell values for each row, keyed by row key, in display order.
+        """
+        table = self._data_table
+        if table is None:
+            return
+
+        previous = self._rendered_rows
+        kept = [row_key for row_key in previous if row_key in rows]
+        new_keys = list(rows)
+        with self.app.batch_update():
+            # With no rows kept, clearing is cheaper than removing them one by one
+            if (kept or not previous) and new_keys[: len(kept)] == kept:
+                for row_key in previous.keys() - rows.keys():
+                    table.remove_row(row_key)
+                column_keys = list(table.columns)
+                for row_key in kept:
+                    for column_key, value, old_value in zip(
+                        column_keys, rows[row_key], previous[row_key], strict=True
+                    ):
+                        if value != old_value:
+                            table.update_cell(row_key, column_key, value, update_width=True)
+                for row_key in new_keys[len(kept) :]:
+                    table.add_row(*rows[row_key], key=row_key)
+            else:
+                table.clear()
+                for row_key, cells in rows.items():
+                    table.add_row(*cells, key=row_key)
+
+        self._rendered_rows = rows
+        self._row_keys = new_keys
+
+    def _show_items(self, items: list[Any]) -> None:
+        """Render items into the table and update the section state.
+
+        Shared tail of the subclasses' update_data, which store their typed
+        items first.
+
+        Args:
+            items: The items to display, in display order.
+        """
+        self._stop_refreshing()
+        if self._data_table is None:
+            return
+
+        # Rows are keyed by URL for browser opening. They are formatted once
+        # and double as the fingerprint for skipping unchanged updates.
+        rows = self._rows_for(items)
+        # Items sharing a URL collapse into one row, so count what is shown
+        self._item_count = len(rows)
+        if self._is_already_rendered(rows):
+            return
+        self._render_rows(rows)
+
+        if not items:
+            self.state = SectionState.EMPTY
+            return
+
+        # Show data if any item could be formatted, otherwise show empty state
+        self.state = SectionState.DATA if rows else SectionState.EMPTY
+        self._update_border_title()
+
+    def _rows_for(self, _items: list[Any]) -> dict[str, tuple[str, ...]]:
+        """Format items as table rows keyed by URL.
+
+        The base section has no columns, so it renders no rows. Subclasses
+        override this to produce their section's columns.
+        """
+        return {}
+
+    def _update_border_title(self) -> None:
+        """Update the border title with count."""
+        if self.state == SectionState.DATA:
+            self.border_title = f"{self.section_title} ({self._item_count})"
+        else:
+            self.border_title = self.section_title
+        self._update_adapter_subtitle()
+
+    def _update_adapter_subtitle(self) -> None:
+        """Update border subtitle with adapter icons.
+
+        Subclasses should override this to list the adapters of their data.
+        """
+
+    def show_loading(self, status: str = "", *, keep_data: bool = False) -> None:
         """Set section to loading state.
 
         Args:
             status: Optional status message to display with the spinner.
+            keep_data: If True and rows are already displayed, leave them
+                visible and show the spinner below them instead.
         """
         self.loading_status = status
+        if keep_data and self.state == SectionState.DATA:
+            self._refreshing = True
+            self._update_visibility()
+            return
         self.state = SectionState.LOADING
 
-    def set_error(self, message: str) -> None:
+    def _stop_refreshing(self) -> None:
+        """Hide the spinner shown below the rows by show_loading(keep_data=True)."""
+        if self._refreshing:
+            self._refreshing = False
+            self._update_visibility()
+
+    def set_error(self, message: str, *, keep_data: bool = False) -> None:
         """Set section to error state with message.
 
         Args:
             message: The error message to display.
+            keep_data: If True and rows are already displayed, leave them
+                visible instead of replacing them with the error.
         """
+        self._stop_refreshing()
+        if keep_data and self.state == SectionState.DATA:
+            return
         self.error_message = message
         self.state = SectionState.ERROR
 
-    def _truncate_title(self, title: str, max_length: int = 40) -> str:
+    @staticmethod
+    def _truncate_title(title: str, max_length: int = 40) -> str:
         """Truncate title with ellipsis if too long.
 
         Args:
@@ -215,22 +366,22 @@ class BaseSection(Static):
         Returns:
             Truncated title with ellipsis if needed.
         """
-        if len(title) <= max_length:
-            return title
-        return title[: max_length - 3] + "..."
+        return title if len(title) <= max_length else title[: max_length - 3] + "..."
 
-    def _format_date(self, dt: datetime | None) -> str:
+    @staticmethod
+    def _format_date(dt: datetime | None) -> str:
         """Format datetime for display.
 
         Args:
             dt: The datetime to format.
 
         Returns:
-            Formatted date string or empty string if None.
+            Formatted date string (YYYY-MM-DD) or empty string if None.
         """
         if dt is None:
             return ""
-        return dt.strftime("%Y-%m-%d")
+        # Same output as strftime("%Y-%m-%d") without the locale-aware formatter
+        return dt.date().isoformat()
 
     def focus_table(self) -> None:
         """Focus the internal DataTable widget.
@@ -257,12 +408,36 @@ class BaseSection(Static):
         if self._data_table is not None and self.state == SectionState.DATA:
             self._data_table.action_cursor_up()
 
+    def get_selected_url(self) -> str | None:
+        """Get the URL of the currently selected row.
+
+        Returns:
+            The URL of the selected item, or None if no selection.
+        """
+        if self._data_table is None:
+            return None
+
+        # cursor_row is the index (0, 1, 2, ...); rows are keyed by URL
+        row_index = self._data_table.cursor_row
+        if row_index is None or not 0 <= row_index < len(self._row_keys):
+            return None
+        return self._row_keys[row_index]
+
     def action_open_selected(self) -> None:
-        """Open the selected item in browser."""
+        """Open the selected item in browser.
+
+        Launching the browser may spawn a subprocess, so it runs in a
+        thread worker and the key handler returns immediately.
+        """
         url = self.get_selected_url()
         if url:
-            with suppress(Exception):
-                webbrowser.open(url)
+            self.run_worker(
+                partial(webbrowser.open, url),
+                name="open-browser",
+                group="open-browser",
+                thread=True,
+                exit_on_error=False,
+            )
 
     def action_move_down(self) -> None:
         """Action handler to move selection down."""
@@ -377,7 +552,6 @@ class CodeReviewSubSection(BaseSection):
     def __init__(self, *args: object, **kwargs: object) -> None:
         """Initialize the code review subsection."""
         super().__init__("Code Reviews", *args, **kwargs)
-        self._item_count = 0
         self._col_keys: dict[str, Any] = {}
         self.subsection_type = ""
 
@@ -396,14 +570,6 @@ class CodeReviewSubSection(BaseSection):
             self._setup_table()
         self._update_border_title()
 
-    def _update_border_title(self) -> None:
-        """Update the border title with count."""
-        if self.state == SectionState.DATA:
-            self.border_title = f"{self.section_title} ({self._item_count})"
-        else:
-            self.border_title = self.section_title
-        self._update_adapter_subtitle()
-
     def _update_adapter_subtitle(self) -> None:
         """Update border subtitle with adapter icons."""
         adapters = self._get_adapter_info()
@@ -416,13 +582,11 @@ class CodeReviewSubSection(BaseSection):
         """Get unique adapter (icon, name) pairs from current data."""
         if not self.code_reviews:
             return []
-        seen: set[str] = set()
-        adapters: list[tuple[str, str]] = []
+        # Dicts keep insertion order, so this dedups in one pass
+        icons: dict[str, str] = {}
         for cr in self.code_reviews:
-            if cr.adapter_type not in seen:
-                seen.add(cr.adapter_type)
-                adapters.append((cr.adapter_icon, cr.adapter_type.title()))
-        return adapters
+            icons.setdefault(cr.adapter_type, cr.adapter_icon)
+        return [(icon, adapter_type.title()) for adapter_type, icon in icons.items()]
 
     def _setup_table(self) -> None:
         """Setup DataTable columns with reserved space for sort indicators."""
@@ -456,36 +620,9 @@ class CodeReviewSubSection(BaseSection):
         Args:
             code_reviews: List of CodeReview models to display.
         """
-        self.code_reviews = code_reviews
-        self._item_count = len(code_reviews)
-
-        if self._data_table is None:
-            return
-
-        # Clear existing rows
-        self._data_table.clear()
-
-        if not code_reviews:
-            self.state = SectionState.EMPTY
-            return
-
-        # Add rows
-        for cr in code_reviews:
-            created = self._format_date(cr.created_at)
-
-            self._data_table.add_row(
-                cr.display_key(),
-                self._truncate_title(cr.title),
-                cr.display_status(),
-                cr.author,
-                cr.source_branch,
-                created,
-                key=cr.url,  # Store URL for browser opening
-            )
-
-        self.state = SectionState.DATA
-
-        self._update_border_title()
+        # Stored without invoking watch_code_reviews, which would re-enter this method
+        self.set_reactive(CodeReviewSubSection.code_reviews, code_reviews)
+        self._show_items(code_reviews)
 
     def _perform_sort(self) -> None:
         """Sort code reviews by current sort state."""
@@ -495,8 +632,6 @@ class CodeReviewSubSection(BaseSection):
         if self.sort_state is None or self.sort_state.method == SortMethod.NONE:
             return
 
-        from monokl.ui.sorting import get_code_review_sort_key
-
         sort_method = self.sort_state.method
         sort_descending = self.sort_state.descending
 
@@ -506,18 +641,31 @@ class CodeReviewSubSection(BaseSection):
             reverse=sort_descending,
         )
 
-        self._data_table.clear()
-        for cr in sorted_reviews:
-            created = self._format_date(cr.created_at)
-            self._data_table.add_row(
+        self._render_rows(self._rows_for(sorted_reviews))
+
+    def _rows_for(self, code_reviews: list[CodeReview]) -> dict[str, tuple[str, ...]]:
+        """Format code reviews as table rows keyed by URL.
+
+        Args:
+            code_reviews: Code reviews in display order.
+
+        Returns:
+            Cell values in column order for each code review, keyed by its URL.
+        """
+        # Bound once, since they are called for every row
+        truncate = self._truncate_title
+        format_date = self._format_date
+        return {
+            cr.url: (
                 cr.display_key(),
-                self._truncate_title(cr.title),
+                truncate(cr.title),
                 cr.display_status(),
                 cr.author,
                 cr.source_branch,
-                created,
-                key=cr.url,
+                format_date(cr.created_at),
             )
+            for cr in code_reviews
+        }
 
     def _update_header_indicators(self) -> None:
         """Update column headers with sort indicators."""
@@ -543,46 +691,6 @@ class CodeReviewSubSection(BaseSection):
                 f"Created{date_indicator}"
             )
 
-    def get_selected_url(self) -> str | None:
-        """Get the URL of the currently selected row.
-
-        Returns:
-            The URL of the selected code review, or None if no selection.
-        """
-        if self._data_table is None:
-            return None
-
-        # cursor_row is the index (0, 1, 2, ...)
-        row_index = self._data_table.cursor_row
-        if row_index is None:
-            return None
-
-        # Get the row key at the cursor index
-        try:
-            # Get the row coordinate and extract the key
-            row_keys = list(self._data_table.rows.keys())
-            if row_index < 0 or row_index >= len(row_keys):
-                return None
-
-            # The row key is the URL we stored when adding the row
-            row_key = row_keys[row_index]
-            if hasattr(row_key, "value"):
-                return str(row_key.value)
-            if isinstance(row_key, str):
-                return row_key
-
-            # Fallback: try to get row data and find code review
-            row = self._data_table.get_row_at(row_index)
-            if row:
-                key = row[0]  # Key column
-                for cr in self.code_reviews:
-                    if cr.display_key() == key:
-                        return cr.url
-        except (KeyError, IndexError, AttributeError):
-            pass
-
-        return None
-
 
 # Backwards compatibility alias
 MergeRequestSection = CodeReviewSubSection
@@ -633,10 +741,13 @@ class CodeReviewSection(Static):
         self.assigned_to_me_section = CodeReviewSubSection(id="cr-assigned-to-me")
         self.assigned_to_me_section.section_title = "Assigned / Pending review"
         self.assigned_to_me_section.subsection_type = "assigned"
+        # Layout applied by _update_layout, or None before the first call
+        self._layout: str | None = None
 
     def compose(self) -> ComposeResult:
         """Compose the container with two code review subsections."""
-        with Vertical(id="cr-subsections"):
+        self._subsections = Vertical(id="cr-subsections")
+        with self._subsections:
             yield self.assigned_to_me_section
             yield self.opened_by_me_section
 
@@ -652,36 +763,37 @@ class CodeReviewSection(Static):
         """Update layout direction based on container width.
 
         Uses horizontal layout (columns) when wide, vertical layout (rows) when narrow.
+        Resizes that don't cross LAYOUT_THRESHOLD leave the styles untouched.
         """
-        subsections = self.query_one("#cr-subsections", Vertical)
-        width = self.size.width
+        # Narrow terminal: rows; wide terminal: columns
+        layout = "vertical" if self.size.width < self.LAYOUT_THRESHOLD else "horizontal"
+        if layout == self._layout:
+            return
+        self._layout = layout
 
-        if width < self.LAYOUT_THRESHOLD:
-            # Narrow terminal: use vertical layout (rows)
-            subsections.styles.layout = "vertical"
-            subsections.add_class("vertical")
-        else:
-            # Wide terminal: use horizontal layout (columns)
-            subsections.styles.layout = "horizontal"
-            subsections.remove_class("vertical")
+        subsections = self._subsections
+        subsections.styles.layout = layout
+        subsections.set_class(layout == "vertical", "vertical")
 
-    def show_loading(self, status: str = "") -> None:
+    def show_loading(self, status: str = "", *, keep_data: bool = False) -> None:
         """Set both subsections to loading state.
 
         Args:
             status: Optional status message to display with the spinner.
+            keep_data: If True, subsections already displaying rows keep them.
         """
-        self.opened_by_me_section.show_loading(status)
-        self.assigned_to_me_section.show_loading(status)
+        self.opened_by_me_section.show_loading(status, keep_data=keep_data)
+        self.assigned_to_me_section.show_loading(status, keep_data=keep_data)
 
-    def set_error(self, message: str) -> None:
+    def set_error(self, message: str, *, keep_data: bool = False) -> None:
         """Set both subsections to error state.
 
         Args:
             message: The error message to display.
+            keep_data: If True, subsections already displaying rows keep them.
         """
-        self.opened_by_me_section.set_error(message)
-        self.assigned_to_me_section.set_error(message)
+        self.opened_by_me_section.set_error(message, keep_data=keep_data)
+        self.assigned_to_me_section.set_error(message, keep_data=keep_data)
 
     def update_opened_by_me(self, code_reviews: list[CodeReview]) -> None:
         """Update the "Opened by me" subsection.
@@ -699,6 +811,17 @@ class CodeReviewSection(Static):
         """
         self.assigned_to_me_section.update_data(code_reviews)
 
+    def update_all(self, assigned: list[CodeReview], opened: list[CodeReview]) -> None:
+        """Update both subsections in a single screen update.
+
+        Args:
+            assigned: Code reviews assigned to the current user.
+            opened: Code reviews authored by the current user.
+        """
+        with self.app.batch_update():
+            self.assigned_to_me_section.update_data(assigned)
+            self.opened_by_me_section.update_data(opened)
+
     def get_active_section(self, section_type: str) -> CodeReviewSubSection | None:
         """Get one of the subsections by type.
 
@@ -781,7 +904,6 @@ class PieceOfWorkSection(BaseSection):
     def __init__(self, *args: object, **kwargs: object) -> None:
         """Initialize the piece of work section."""
         super().__init__("Work Items", *args, **kwargs)
-        self._item_count = 0
         self._col_keys: dict[str, Any] = {}
 
     def on_click(self) -> None:
@@ -803,23 +925,14 @@ class PieceOfWorkSection(BaseSection):
         """Get unique adapter (icon, name) pairs from current data."""
         if not self.work_items:
             return []
-        seen: set[str] = set()
-        adapters: list[tuple[str, str]] = []
+        # Dicts keep insertion order, so this dedups in one pass
+        icons: dict[str, str] = {}
         for item in self.work_items:
             adapter_type = getattr(item, "adapter_type", None)
             icon = getattr(item, "adapter_icon", None)
-            if adapter_type and icon and adapter_type not in seen:
-                seen.add(adapter_type)
-                adapters.append((icon, adapter_type.title()))
-        return adapters
-
-    def _update_border_title(self) -> None:
-        """Update the border title with count."""
-        if self.state == SectionState.DATA:
-            self.border_title = f"{self.section_title} ({self._item_count})"
-        else:
-            self.border_title = self.section_title
-        self._update_adapter_subtitle()
+            if adapter_type and icon:
+                icons.setdefault(adapter_type, icon)
+        return [(icon, adapter_type.title()) for adapter_type, icon in icons.items()]
 
     def _update_adapter_subtitle(self) -> None:
         """Update border subtitle with adapter icons."""
@@ -867,58 +980,9 @@ class PieceOfWorkSection(BaseSection):
         Args:
             work_items: List of PieceOfWork models.
         """
-        self.work_items = work_items
-        self._item_count = len(work_items)
-
-        if self._data_table is None:
-            return
-
-        # Clear existing rows
-        self._data_table.clear()
-
-        if not work_items:
-            self.state = SectionState.EMPTY
-            return
-
-        # Add rows
-        added_count = 0
-        for item in work_items:
-            try:
-                icon = item.adapter_icon
-                key = item.display_key()
-                title = self._truncate_title(item.title)
-                status = item.display_status()
-                priority = str(item.priority) if item.priority else ""
-                context = item.assignee or ""
-                due_date_str = item.due_date or ""
-                created_str = item.created or ""
-                updated_str = item.updated or ""
-                url = item.url
-
-                self._data_table.add_row(
-                    icon,
-                    key,
-                    title,
-                    status,
-                    priority,
-                    context,
-                    due_date_str,
-                    created_str,
-                    updated_str,
-                    key=url,  # Store URL for browser opening
-                )
-                added_count += 1
-            except Exception:
-                # Skip items that fail to process
-                continue
-
-        # Show data if we added any rows, otherwise show empty state
-        if added_count > 0:
-            self.state = SectionState.DATA
-        else:
-            self.state = SectionState.EMPTY
-
-        self._update_border_title()
+        # Stored without invoking watch_work_items, which would re-enter this method
+        self.set_reactive(PieceOfWorkSection.work_items, work_items)
+        self._show_items(work_items)
 
     def _perform_sort(self) -> None:
         """Sort work items by current sort state."""
@@ -928,8 +992,6 @@ class PieceOfWorkSection(BaseSection):
         if self.sort_state is None or self.sort_state.method == SortMethod.NONE:
             return
 
-        from monokl.ui.sorting import get_work_item_sort_key
-
         sort_method = self.sort_state.method
         sort_descending = self.sort_state.descending
 
@@ -939,34 +1001,38 @@ class PieceOfWorkSection(BaseSection):
             reverse=sort_descending,
         )
 
-        self._data_table.clear()
-        for item in sorted_items:
+        self._render_rows(self._rows_for(sorted_items))
+
+    def _rows_for(self, work_items: list[PieceOfWork]) -> dict[str, tuple[str, ...]]:
+        """Format work items as table rows keyed by URL.
+
+        Args:
+            work_items: Work items in display order.
+
+        Returns:
+            Cell values in column order for each item, keyed by its URL.
+            Items that fail to format are skipped.
+        """
+        # Bound once, since it is called for every row
+        truncate = self._truncate_title
+        rows: dict[str, tuple[str, ...]] = {}
+        for item in work_items:
             try:
-                icon = item.adapter_icon
-                key = item.display_key()
-                title = self._truncate_title(item.title)
-                status = item.display_status()
-                priority = str(item.priority) if item.priority else ""
-                context = item.assignee or ""
-                due_date_str = item.due_date or ""
-                created_str = item.created or ""
-                updated_str = item.updated or ""
-                url = item.url
-
-                self._data_table.add_row(
-                    icon,
-                    key,
-                    title,
-                    status,
-                    priority,
-                    context,
-                    due_date_str,
-                    created_str,
-                    updated_str,
-                    key=url,
+                rows[item.url] = (
+                    item.adapter_icon,
+                    item.display_key(),
+                    truncate(item.title),
+                    item.display_status(),
+                    str(item.priority) if item.priority else "",
+                    item.assignee or "",
+                    item.due_date or "",
+                    item.created or "",
+                    item.updated or "",
                 )
             except Exception:
+                # Skip items that fail to process
                 continue
+        return rows
 
     def _update_header_indicators(self) -> None:
         """Update column headers with sort indicators."""
@@ -1013,46 +1079,6 @@ class PieceOfWorkSection(BaseSection):
                 f"Updated{updated_indicator}"
             )
 
-    def get_selected_url(self) -> str | None:
-        """Get the URL of the currently selected row.
-
-        Returns:
-            The URL of the selected work item, or None if no selection.
-        """
-        if self._data_table is None:
-            return None
-
-        # cursor_row is the index (0, 1, 2, ...)
-        row_index = self._data_table.cursor_row
-        if row_index is None:
-            return None
-
-        # Get the row key at the cursor index
-        try:
-            # Get the row coordinate and extract the key
-            row_keys = list(self._data_table.rows.keys())
-            if row_index < 0 or row_index >= len(row_keys):
-                return None
-
-            # The row key is the URL we stored when adding the row
-            row_key = row_keys[row_index]
-            if hasattr(row_key, "value"):
-                return str(row_key.value)
-            if isinstance(row_key, str):
-                return row_key
-
-            # Fallback: try to get row data and find work item
-            row = self._data_table.get_row_at(row_index)
-            if row:
-                key = row[0]  # Key column
-                for item in self.work_items:
-                    if item.display_key() == key:
-                        return item.url
-        except (KeyError, IndexError, AttributeError):
-            pass
-
-        return None
-
 
 # Backwards compatibility alias
 WorkItemSection = PieceOfWorkSection
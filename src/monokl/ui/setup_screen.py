@@ -32,6 +32,7 @@ from monokl.sources.base import AdapterStatus
 from monokl.sources.integrations import get_all_integrations
 
 if TYPE_CHECKING:
+    from monokl.config import Config
     from monokl.sources.base import SetupCapableSource
     from monokl.sources.integrations import IntegrationMeta
 
@@ -107,15 +108,16 @@ class IntegrationCard(Container):
     def __init__(
         self,
         integration: IntegrationMeta,
+        *,
+        config: Config | None = None,
     ) -> None:
         super().__init__()
         self._integration = integration
         self.integration_id = integration.id
-        self._init_adapter_selection()
+        self._init_adapter_selection(config or get_config())
 
-    def _init_adapter_selection(self) -> None:
+    def _init_adapter_selection(self, config: Config) -> None:
         """Determine the initial adapter selection based on config and availability."""
-        config = get_config()
         selected = config.get_selected_adapter(self._integration.id)
         available = self._integration.available_adapters
         cli_available = self._integration.cli_name and shutil.which(self._integration.cli_name)
@@ -329,8 +331,10 @@ class SetupScreen(Screen):
                 classes="section-description",
             )
             with Vertical(id="integrations-grid"):
+                # Load the config once for all cards instead of once per card
+                config = get_config()
                 for integration in get_all_integrations():
-                    yield IntegrationCard(integration)
+                    yield IntegrationCard(integration, config=config)
         yield Footer()
 
     def on_mount(self) -> None:
@@ -8,6 +8,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import Enum
+from operator import itemgetter
 from typing import TYPE_CHECKING
 from typing import Any
 
@@ -60,6 +61,18 @@ SORT_INDICATOR_ASC = " ▲"
 SORT_INDICATOR_DESC = " ▼"
 SORT_INDICATOR_NONE = "  "
 
+# Rank tables for status sorting; unknown values sort last
+_WORK_ITEM_STATUS_ORDER = {
+    "IN PROGRESS": 1,
+    "IN_PROGRESS": 1,
+    "TODO": 2,
+    "OPEN": 2,
+    "BLOCKED": 3,
+    "DONE": 4,
+    "CLOSED": 4,
+}
+_CODE_REVIEW_STATE_ORDER = {"open": 1, "merged": 2, "closed": 3}
+
 
 def get_sort_indicator(state: SortState | None) -> str:
     """Get the visual indicator for current sort state."""
@@ -84,17 +97,8 @@ def get_work_item_sort_key(item: PieceOfWork, method: SortMethod) -> Any:
             return 0
         return priority
     if method == SortMethod.STATUS:
-        status_order = {
-            "IN PROGRESS": 1,
-            "IN_PROGRESS": 1,
-            "TODO": 2,
-            "OPEN": 2,
-            "BLOCKED": 3,
-            "DONE": 4,
-            "CLOSED": 4,
-        }
         status_upper = item.display_status().upper()
-        return status_order.get(status_upper, 5)
+        return _WORK_ITEM_STATUS_ORDER.get(status_upper, 5)
     if method in (SortMethod.DATE, SortMethod.DUE_DATE):
         due = item.due_date
         if due is None:
@@ -124,10 +128,33 @@ def get_code_review_sort_key(review: CodeReview, method: SortMethod) -> Any:
         A comparable value for sorting.
     """
     if method == SortMethod.PRIORITY or method == SortMethod.STATUS:
-        state_order = {"open": 1, "merged": 2, "closed": 3}
-        return state_order.get(review.state.lower(), 4)
+        return _CODE_REVIEW_STATE_ORDER.get(review.state.lower(), 4)
     if method == SortMethod.DATE:
         if review.created_at is None:
             return ""
         return review.created_at.isoformat()
     return 0
+
+
+def sort_open_first(items: list[PieceOfWork]) -> list[PieceOfWork]:
+    """Sort work items with open ones first, each group ordered by display key.
+
+    Partitions items by open state in a single pass, precomputing display keys,
+    so is_open() and display_key() are called exactly once per item.
+
+    Args:
+        items: The work items to sort.
+
+    Returns:
+        A new list with open items first, then closed items.
+    """
+    open_items: list[tuple[str, PieceOfWork]] = []
+    closed_items: list[tuple[str, PieceOfWork]] = []
+    for item in items:
+        group = open_items if item.is_open() else closed_items
+        group.append((item.display_key(), item))
+
+    by_key = itemgetter(0)
+    open_items.sort(key=by_key)
+    closed_items.sort(key=by_key)
+    return [item for _, item in open_items] + [item for _, item in closed_items]
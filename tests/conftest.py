@@ -109,5 +109,5 @@ async def app_with_stub_store(
     def mock_create_store(config: Any) -> WorkStore:
         return stub_work_store
 
-    monkeypatch.setattr("monokl.ui.work_store_factory.create_work_store", mock_create_store)
+    monkeypatch.setattr("monokl.ui.main_screen.create_work_store", mock_create_store)
     return app
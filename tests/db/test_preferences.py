@@ -155,6 +155,25 @@ class TestPreferencesManager:
 
         await db.close()
 
+    @pytest.mark.asyncio
+    async def test_ui_state_round_trip(self, tmp_path, prefs_manager):
+        """Test saving and restoring section and subsection together."""
+        db_path = tmp_path / "test.db"
+        db = DatabaseManager(str(db_path))
+        await db.initialize()
+
+        # Defaults when nothing is stored
+        assert await prefs_manager.get_ui_state() == ("mr", "assigned")
+
+        await prefs_manager.set_ui_state("work", "opened")
+        assert await prefs_manager.get_ui_state() == ("work", "opened")
+
+        # Stored under the same keys as the single-value helpers
+        assert await prefs_manager.get_last_active_section() == "work"
+        assert await prefs_manager.get_last_mr_subsection() == "opened"
+
+        await db.close()
+
     @pytest.mark.asyncio
     async def test_update_existing(self, tmp_path, prefs_manager):
         """Test updating existing preferences."""
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+
 import pytest
 
 from monokl.db import FetchResult
@@ -206,6 +208,31 @@ class TestWorkStore:
 
         await db.close()
 
+    @pytest.mark.asyncio
+    async def test_is_fresh_all_sources(self, tmp_path):
+        """Test that all_sources requires every source's cache to be fresh."""
+        db_path = tmp_path / "test_all_fresh.db"
+        db = DatabaseManager(str(db_path))
+        await db.initialize()
+
+        from monokl.sources.registry import SourceRegistry
+
+        registry = SourceRegistry()
+        registry.register_code_review_source(MockCodeReviewSource("first"))
+        registry.register_code_review_source(MockCodeReviewSource("second"))
+
+        store = WorkStore(registry)
+
+        await store.get_code_reviews_bulk(["assigned", "opened"], force_refresh=True)
+        assert await store.is_fresh("code_reviews", all_sources=True) is True
+
+        # One stale source is enough to need a refetch
+        await store.invalidate(data_type="code_reviews", source="second")
+        assert await store.is_fresh("code_reviews") is True
+        assert await store.is_fresh("code_reviews", all_sources=True) is False
+
+        await db.close()
+
     @pytest.mark.asyncio
     async def test_partial_failure(self, tmp_path):
         """Test handling of partial source failures."""
@@ -265,6 +292,154 @@ class TestWorkStore:
 
         await db.close()
 
+    @pytest.mark.asyncio
+    async def test_get_code_reviews_bulk_reads_cache(self, tmp_path):
+        """Test bulk lookup returns cached results for every subsection."""
+        db_path = tmp_path / "test_bulk.db"
+        db = DatabaseManager(str(db_path))
+        await db.initialize()
+
+        from monokl.sources.registry import SourceRegistry
+
+        assigned = CodeReview(
+            id="1",
+            key="MR-1",
+            title="Assigned MR",
+            state="open",
+            author="Test",
+            url="https://gitlab.com/test/1",
+            adapter_type="mock",
+            adapter_icon="🧪",
+        )
+        opened = CodeReview(
+            id="2",
+            key="MR-2",
+            title="Opened MR",
+            state="open",
+            author="Test",
+            url="https://gitlab.com/test/2",
+            adapter_type="mock",
+            adapter_icon="🧪",
+        )
+
+        registry = SourceRegistry()
+        registry.register_code_review_source(
+            MockCodeReviewSource("mock", assigned=[assigned], authored=[opened])
+        )
+        store = WorkStore(registry)
+
+        # Populate cache
+        await store.get_code_reviews_bulk(["assigned", "opened"], force_refresh=True)
+
+        results = await store.get_code_reviews_bulk(["assigned", "opened"])
+        assert set(results) == {"assigned", "opened"}
+        assert [r.title for r in results["assigned"].data] == ["Assigned MR"]
+        assert [r.title for r in results["opened"].data] == ["Opened MR"]
+        assert results["assigned"].fresh is False
+
+        await db.close()
+
+    @pytest.mark.asyncio
+    async def test_get_code_reviews_bulk_fetches_subsections_concurrently(self, tmp_path):
+        """Test assigned and opened fetches overlap instead of running back to back."""
+        db_path = tmp_path / "test_bulk_concurrent.db"
+        db = DatabaseManager(str(db_path))
+        await db.initialize()
+
+        from monokl.sources.registry import SourceRegistry
+
+        authored_started = asyncio.Event()
+
+        class OverlapCheckingSource(MockCodeReviewSource):
+            async def fetch_assigned(self) -> list[CodeReview]:
+                # Only completes if fetch_authored runs while this one is waiting
+                await asyncio.wait_for(authored_started.wait(), timeout=1.0)
+                return []
+
+            async def fetch_authored(self) -> list[CodeReview]:
+                authored_started.set()
+                return []
+
+        registry = SourceRegistry()
+        registry.register_code_review_source(OverlapCheckingSource("mock"))
+        store = WorkStore(registry)
+
+        results = await store.get_code_reviews_bulk(["assigned", "opened"], force_refresh=True)
+        assert results["assigned"].failed_sources == []
+        assert results["opened"].failed_sources == []
+
+        await db.close()
+
+    @pytest.mark.asyncio
+    async def test_stale_cache_read_can_skip_background_refresh(self, tmp_path):
+        """Test refresh_stale=False returns stale data without scheduling a refetch."""
+        db_path = tmp_path / "test_refresh_stale.db"
+        db = DatabaseManager(str(db_path))
+        await db.initialize()
+
+        from monokl.sources.registry import SourceRegistry
+
+        review = CodeReview(
+            id="1",
+            key="MR-1",
+            title="Stale MR",
+            state="open",
+            author="Test",
+            url="https://gitlab.com/test/1",
+            adapter_type="mock",
+            adapter_icon="🧪",
+        )
+        registry = SourceRegistry()
+        registry.register_code_review_source(MockCodeReviewSource("mock", assigned=[review]))
+        # A zero TTL makes every cached entry stale immediately
+        store = WorkStore(registry, code_review_ttl=0)
+
+        await store.get_code_reviews("assigned", force_refresh=True)
+
+        results = await store.get_code_reviews_bulk(["assigned"], refresh_stale=False)
+        assert [r.title for r in results["assigned"].data] == ["Stale MR"]
+        assert not store._background_tasks
+
+        await store.get_code_reviews_bulk(["assigned"])
+        assert store._background_tasks
+        await asyncio.gather(*store._background_tasks)
+
+        await db.close()
+
+    @pytest.mark.asyncio
+    async def test_cold_cache_read_can_skip_fetching(self, tmp_path):
+        """Test fetch_missing=False returns empty stale results without fetching."""
+        db_path = tmp_path / "test_fetch_missing.db"
+        db = DatabaseManager(str(db_path))
+        await db.initialize()
+
+        from monokl.sources.registry import SourceRegistry
+
+        class FailingCodeReviewSource(MockCodeReviewSource):
+            async def fetch_assigned(self) -> list[CodeReview]:
+                msg = "cache-only read must not fetch"
+                raise AssertionError(msg)
+
+        class FailingPieceOfWorkSource(MockPieceOfWorkSource):
+            async def fetch_items(self) -> list[PieceOfWork]:
+                msg = "cache-only read must not fetch"
+                raise AssertionError(msg)
+
+        registry = SourceRegistry()
+        registry.register_code_review_source(FailingCodeReviewSource("mock"))
+        registry.register_piece_of_work_source(FailingPieceOfWorkSource("mock"))
+        store = WorkStore(registry)
+
+        results = await store.get_code_reviews_bulk(["assigned"], fetch_missing=False)
+        assert results["assigned"].data == []
+        assert results["assigned"].fresh is False
+
+        result = await store.get_work_items(fetch_missing=False)
+        assert result.data == []
+        assert result.fresh is False
+
+        await db.close()
+
     @pytest.mark.asyncio
     async def test_fetch_result_structure(self):
         """Test FetchResult dataclass structure."""
@@ -231,7 +231,7 @@ async def app_with_mocked_store(
     def mock_create_store(config: Any) -> WorkStore:
         return store
 
-    monkeypatch.setattr("monokl.ui.work_store_factory.create_work_store", mock_create_store)
+    monkeypatch.setattr("monokl.ui.main_screen.create_work_store", mock_create_store)
 
     yield app
 
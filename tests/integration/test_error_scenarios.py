@@ -74,7 +74,7 @@ async def test_auth_failure_display_in_ui(monkeypatch, temp_db_path) -> None:
     def mock_create_store(config):
         return store
 
-    monkeypatch.setattr("monokl.ui.work_store_factory.create_work_store", mock_create_store)
+    monkeypatch.setattr("monokl.ui.main_screen.create_work_store", mock_create_store)
 
     async with app.run_test(size=(120, 40)) as pilot:
         await pilot.pause(0.6)
@@ -4,6 +4,7 @@ Comprehensive tests for GitLabAdapter including success cases,
 error handling, and authentication checks.
 """
 
+import asyncio
 import json
 from unittest.mock import AsyncMock
 from unittest.mock import patch
@@ -349,6 +350,22 @@ class TestFetchAssignedMRs:
 
         assert mrs == []
 
+    @pytest.mark.asyncio
+    async def test_gitlab_remote_is_probed_once_for_concurrent_fetches(self) -> None:
+        """Concurrent MR queries without a group share a single remote probe."""
+        adapter = GitLabAdapter()
+        probe = AsyncMock(return_value=False)
+
+        with patch.object(adapter, "_has_gitlab_remote", new=probe):
+            results = await asyncio.gather(
+                adapter.fetch_assigned_mrs(group=None),
+                adapter.fetch_assigned_mrs(group=None, assignee="", author="@me"),
+            )
+            await adapter.fetch_assigned_mrs(group=None, reviewer="@me")
+
+        assert results == [[], []]
+        probe.assert_awaited_once()
+
     @pytest.mark.asyncio
     async def test_fetch_assigned_mrs_with_reviewer_filter(self) -> None:
         """Test fetch with reviewer filter for pending reviews."""
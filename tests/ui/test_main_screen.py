@@ -62,6 +62,20 @@ async def test_tab_switching_updates_active_section(app_with_stub_store) -> None
         assert screen.active_section == "work"
 
 
+async def test_tab_back_to_code_reviews_highlights_assigned(app_with_stub_store) -> None:
+    async with app_with_stub_store.run_test() as pilot:
+        await pilot.pause(0.2)
+        screen = cast("MainScreen", pilot.app.screen)
+
+        await pilot.press("tab", "tab", "tab")
+
+        assert screen.active_section == "mr"
+        assert screen.active_mr_subsection == "assigned"
+        assert screen.code_review_section.assigned_to_me_section.has_class("active")
+        assert not screen.code_review_section.opened_by_me_section.has_class("active")
+        assert not screen._work_container.has_class("active")
+
+
 async def test_refresh_invokes_section_reload(
     app_with_stub_store,
     stub_gitlab_source,
@@ -87,6 +101,42 @@ async def test_refresh_invokes_section_reload(
         assert reviews[0].id == "gitlab-2"
 
 
+async def test_rapid_refresh_presses_are_debounced(app_with_stub_store) -> None:
+    async with app_with_stub_store.run_test() as pilot:
+        await pilot.pause(0.6)
+        screen = cast("MainScreen", pilot.app.screen)
+
+        refreshes: list[str] = []
+
+        async def record_refresh(**_kwargs: object) -> None:
+            refreshes.append(screen.active_section)
+
+        screen.fetch_code_reviews = record_refresh  # type: ignore[method-assign]
+        await pilot.press("r", "r", "r")
+        await pilot.pause()
+
+        assert refreshes == ["mr"]
+
+
+async def test_refresh_is_skipped_while_fetch_in_progress(app_with_stub_store, monkeypatch) -> None:
+    async with app_with_stub_store.run_test() as pilot:
+        await pilot.pause(0.6)
+        screen = cast("MainScreen", pilot.app.screen)
+
+        calls: list[list[str]] = []
+
+        async def record_bulk(subsections: list[str], **_kwargs: object) -> object:
+            calls.append(subsections)
+            msg = "fetch should have been skipped"
+            raise AssertionError(msg)
+
+        monkeypatch.setattr(screen._store, "get_code_reviews_bulk", record_bulk)
+        screen.mr_loading = True
+        await screen.fetch_code_reviews()
+
+        assert calls == []
+
+
 async def test_source_failure_sets_error_state(app_with_stub_store, stub_gitlab_source) -> None:
     stub_gitlab_source.assigned_exception = Exception("boom")
 
@@ -97,3 +147,163 @@ async def test_source_failure_sets_error_state(app_with_stub_store, stub_gitlab_
 
         assert section.state in {SectionState.EMPTY, SectionState.ERROR}
         assert "gitlab" in screen._source_errors
+
+
+async def test_manual_refresh_shows_indicator_over_kept_rows(
+    app_with_stub_store,
+    stub_gitlab_source,
+) -> None:
+    stub_gitlab_source.assigned = [
+        make_code_review(idx=1, adapter_type="gitlab", adapter_icon="🦊")
+    ]
+
+    async with app_with_stub_store.run_test() as pilot:
+        await pilot.pause(0.6)
+        screen = cast("MainScreen", pilot.app.screen)
+        section = screen.code_review_section.assigned_to_me_section
+        assert section._spinner_row.styles.display == "none"
+
+        stub_gitlab_source.fetch_delay = 0.5
+        await pilot.press("r")
+        await pilot.pause(0.2)
+        assert screen.mr_loading is True
+        assert section.state == SectionState.DATA
+        assert section._spinner_row.styles.display == "block"
+
+        await pilot.pause(0.6)
+        assert screen.mr_loading is False
+        assert section.state == SectionState.DATA
+        assert section._spinner_row.styles.display == "none"
+
+
+async def test_hung_fetch_times_out_to_error_state(
+    app_with_stub_store,
+    monkeypatch,
+    stub_jira_source,
+) -> None:
+    monkeypatch.setattr("monokl.ui.main_screen.FETCH_TIMEOUT", 0.2)
+    stub_jira_source.fetch_delay = 5.0
+
+    async with app_with_stub_store.run_test() as pilot:
+        await pilot.pause(0.8)
+        screen = cast("MainScreen", pilot.app.screen)
+
+        assert screen.piece_of_work_section.state == SectionState.ERROR
+        assert screen.work_offline is True
+        assert screen.work_loading is False
+
+
+async def test_hung_fetch_timeout_keeps_cached_rows(
+    app_with_stub_store,
+    monkeypatch,
+    stub_work_store,
+    stub_jira_source,
+) -> None:
+    # Seed a stale cache, so startup shows its rows and then refreshes them
+    stub_jira_source.items = [make_jira_item(idx=1)]
+    stub_work_store._work_item_ttl = 0
+    await stub_work_store.get_work_items(force_refresh=True)
+
+    monkeypatch.setattr("monokl.ui.main_screen.FETCH_TIMEOUT", 0.2)
+    stub_jira_source.fetch_delay = 5.0
+
+    async with app_with_stub_store.run_test() as pilot:
+        await pilot.pause(0.8)
+        screen = cast("MainScreen", pilot.app.screen)
+
+        assert screen.piece_of_work_section.state == SectionState.DATA
+        assert screen.work_offline is True
+        assert screen.work_loading is False
+
+
+async def test_startup_refetches_when_one_source_cache_is_stale(
+    app_with_stub_store,
+    stub_work_store,
+    stub_jira_source,
+    stub_todoist_source,
+) -> None:
+    # Jira stays fresh while the Todoist entry is dropped, as after a failed fetch
+    stub_jira_source.items = [make_jira_item(idx=1)]
+    await stub_work_store.get_work_items(force_refresh=True)
+    await stub_work_store.invalidate(data_type="work_items", source="todoist")
+
+    fetches: list[str] = []
+    fetch_items = stub_todoist_source.fetch_items
+
+    async def record_fetch() -> list:
+        fetches.append("todoist")
+        return await fetch_items()
+
+    stub_todoist_source.fetch_items = record_fetch  # type: ignore[method-assign]
+
+    async with app_with_stub_store.run_test() as pilot:
+        await pilot.pause(0.6)
+
+        assert fetches == ["todoist"]
+
+
+async def test_rapid_tab_presses_coalesce_ui_state_saves(app_with_stub_store, monkeypatch) -> None:
+    # Leave headroom for the two key presses on a loaded test machine
+    monkeypatch.setattr("monokl.ui.main_screen.SAVE_UI_STATE_DELAY", 0.5)
+
+    async with app_with_stub_store.run_test() as pilot:
+        await pilot.pause(0.6)
+        screen = cast("MainScreen", pilot.app.screen)
+
+        saves: list[str] = []
+
+        async def record_save() -> None:
+            saves.append(screen.active_section)
+
+        screen._save_ui_state = record_save  # type: ignore[method-assign]
+        await pilot.press("tab", "tab")
+        await pilot.pause(0.8)
+
+        assert saves == ["work"]
+
+
+async def test_quit_writes_pending_ui_state_save_immediately(
+    app_with_stub_store, monkeypatch
+) -> None:
+    monkeypatch.setattr("monokl.ui.main_screen.SAVE_UI_STATE_DELAY", 5.0)
+
+    async with app_with_stub_store.run_test() as pilot:
+        await pilot.pause(0.6)
+        screen = cast("MainScreen", pilot.app.screen)
+
+        saves: list[str] = []
+
+        async def record_save() -> None:
+            saves.append(screen.active_section)
+
+        screen._save_ui_state = record_save  # type: ignore[method-assign]
+        await pilot.press("tab", "tab")
+        await screen.action_quit()
+
+        # Written by the quit itself, long before the debounce delay runs out
+        assert saves == ["work"]
+        assert screen._save_timer is None
+
+
+async def test_quit_exits_when_pending_ui_state_save_fails(
+    app_with_stub_store, monkeypatch
+) -> None:
+    monkeypatch.setattr("monokl.ui.main_screen.SAVE_UI_STATE_DELAY", 5.0)
+
+    async with app_with_stub_store.run_test() as pilot:
+        await pilot.pause(0.6)
+        screen = cast("MainScreen", pilot.app.screen)
+
+        exits: list[bool] = []
+
+        async def failing_save() -> None:
+            msg = "disk full"
+            raise OSError(msg)
+
+        screen._save_ui_state = failing_save  # type: ignore[method-assign]
+        monkeypatch.setattr(pilot.app, "exit", lambda *_args, **_kwargs: exits.append(True))
+        await pilot.press("tab")
+        await screen.action_quit()
+
+        assert exits == [True]
+        assert screen._save_timer is None
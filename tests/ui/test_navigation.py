@@ -75,6 +75,7 @@ async def test_o_key_opens_selected_review(
         screen = cast("MainScreen", pilot.app.screen)
         screen.code_review_section.focus_section("assigned")
         await pilot.press("o")
+        await pilot.app.workers.wait_for_complete()
 
     assert opened == [expected.url]
 
@@ -100,6 +101,7 @@ async def test_o_key_opens_selected_work_item(
         screen = cast("MainScreen", pilot.app.screen)
         screen.piece_of_work_section.focus_table()
         await pilot.press("o")
+        await pilot.app.workers.wait_for_complete()
 
     assert opened == [item.url]
 
@@ -52,6 +52,21 @@ async def test_code_review_subsection_updates_data() -> None:
         assert section._item_count == 2
 
 
+async def test_code_review_subsection_counts_duplicate_urls_once() -> None:
+    section = CodeReviewSubSection()
+    app = SectionHarness(section)
+
+    reviews = [make_code_review(idx=1), make_code_review(idx=1, title="Same URL")]
+
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        section.update_data(reviews)
+        await pilot.pause()
+
+        assert section._item_count == 1
+        assert section.border_title.endswith("(1)")
+
+
 async def test_code_review_subsection_state_transitions() -> None:
     section = CodeReviewSubSection()
     app = SectionHarness(section)
@@ -65,10 +80,105 @@ async def test_code_review_subsection_state_transitions() -> None:
         section.set_error("boom")
         await pilot.pause()
         assert section.state == SectionState.ERROR
+        assert section._message.has_class("error")
 
         section.update_data([])
         await pilot.pause()
         assert section.state == SectionState.EMPTY
+        assert not section._message.has_class("error")
+
+
+async def test_code_review_subsection_keeps_rows_visible_while_refreshing() -> None:
+    section = CodeReviewSubSection()
+    app = SectionHarness(section)
+
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        section.show_loading("Refreshing", keep_data=True)
+        await pilot.pause()
+        assert section.state == SectionState.LOADING
+
+        section.update_data([make_code_review(idx=1)])
+        section.show_loading("Refreshing", keep_data=True)
+        await pilot.pause()
+        assert section.state == SectionState.DATA
+        assert section._spinner_row.styles.display == "block"
+
+        section.update_data([make_code_review(idx=1)])
+        await pilot.pause()
+        assert section._spinner_row.styles.display == "none"
+
+
+async def test_code_review_subsection_skips_rebuild_for_unchanged_data() -> None:
+    section = CodeReviewSubSection()
+    app = SectionHarness(section)
+
+    reviews = [make_code_review(idx=1), make_code_review(idx=2)]
+
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        section.update_data(reviews)
+        await pilot.pause()
+
+        table = section.query_one("#data-table")
+        cleared = 0
+        original_clear = table.clear
+
+        def counting_clear(*args, **kwargs):
+            nonlocal cleared
+            cleared += 1
+            return original_clear(*args, **kwargs)
+
+        table.clear = counting_clear
+
+        section.show_loading("Refreshing")
+        section.update_data([make_code_review(idx=1), make_code_review(idx=2)])
+        await pilot.pause()
+
+        assert cleared == 0
+        assert section.state == SectionState.DATA
+        assert table.row_count == 2
+
+
+async def test_code_review_subsection_patches_changed_cells_in_place() -> None:
+    section = CodeReviewSubSection()
+    app = SectionHarness(section)
+
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        section.update_data([make_code_review(idx=1), make_code_review(idx=2)])
+        await pilot.pause()
+
+        table = section.query_one("#data-table")
+        table.move_cursor(row=1)
+        table.clear = None  # A rebuild would fail here
+
+        section.update_data([make_code_review(idx=1), make_code_review(idx=2, title="Renamed")])
+        await pilot.pause()
+
+        assert table.row_count == 2
+        assert table.cursor_row == 1
+        assert table.get_row_at(1)[1] == "Renamed"
+
+
+async def test_code_review_subsection_removes_and_appends_rows_in_place() -> None:
+    section = CodeReviewSubSection()
+    app = SectionHarness(section)
+
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        section.update_data([make_code_review(idx=1), make_code_review(idx=2)])
+        await pilot.pause()
+
+        table = section.query_one("#data-table")
+        table.clear = None  # A rebuild would fail here
+
+        section.update_data([make_code_review(idx=2), make_code_review(idx=3)])
+        await pilot.pause()
+
+        assert table.row_count == 2
+        assert section.get_selected_url() == make_code_review(idx=2).url
+        assert [table.get_row_at(i)[0] for i in range(2)] == ["!2", "!3"]
 
 
 async def test_code_review_subsection_truncates_long_title() -> None:
@@ -0,0 +1,22 @@
+"""Tests for table sorting utilities."""
+
+from __future__ import annotations
+
+from monokl.ui.sorting import sort_open_first
+from tests.support.factories import make_jira_item
+from tests.support.factories import make_todoist_item
+
+
+def test_sort_open_first_orders_open_items_by_key() -> None:
+    done = make_jira_item(idx=1, status="Done")
+    open_b = make_jira_item(idx=3)
+    open_a = make_jira_item(idx=2)
+    completed = make_todoist_item(idx=1, completed=True)
+
+    result = sort_open_first([done, open_b, completed, open_a])
+
+    assert result == [open_a, open_b, done, completed]
+
+
+def test_sort_open_first_handles_empty_list() -> None:
+    assert sort_open_first([]) == []